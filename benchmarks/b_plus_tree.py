@@ -0,0 +1,42 @@
+"""
+Compare BPlusTree with AVLTree.
+
+Usage: python -m benchmarks.b_plus_tree [n]
+"""
+import random
+import sys
+from time import perf_counter
+
+from sacks.sets import AVLTree, BPlusTree
+
+
+def timed(f):
+    start = perf_counter()
+    f()
+    return perf_counter() - start
+
+def bench(cls, keys, queries):
+    tree = cls()
+    results = { 'add': timed(lambda: [ tree.add(key) for key in keys ]) }
+    results['contains'] = timed(lambda: [ key in tree for key in queries ])
+    results['iterate'] = timed(lambda: sum(1 for _ in tree))
+    results['irange 1%'] = timed(lambda: [ sum(1 for _ in tree.irange(key, key + len(keys) // 100)) for key in queries[:100] ])
+    results['ceiling'] = timed(lambda: [ tree.ceiling(key, None) for key in queries ])
+    results['remove'] = timed(lambda: [ tree.remove(key) for key in keys ])
+    return results
+
+def main(n=200_000):
+    random.seed(0)
+    keys = random.sample(range(n * 10), n)
+    queries = random.sample(range(n * 10), n)
+
+    results = { cls.__name__: bench(cls, keys, queries) for cls in (AVLTree, BPlusTree) }
+
+    print(f'{"n = " + str(n):<12}', *(f'{name:>12}' for name in results), '   speedup')
+    for op in results['AVLTree']:
+        avl, bplus = results['AVLTree'][op], results['BPlusTree'][op]
+        print(f'{op:<12}', f'{avl:>11.3f}s', f'{bplus:>11.3f}s', f'{avl / bplus:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
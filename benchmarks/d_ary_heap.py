@@ -0,0 +1,75 @@
+"""
+Dijkstra's algorithm on a random graph using `DaryHeap` (with vertices as items, distances as priorities and
+`decrease_key` by vertex) and `PairingHeap` (with (distance, vertex) keys and entry handles), plus plain push/pop of
+n random ints.
+
+Usage: python -m benchmarks.d_ary_heap [n_vertices]
+"""
+import random
+import sys
+from time import perf_counter
+
+from sacks.heaps import DaryHeap, PairingHeap
+
+
+def random_graph(n, degree=8):
+    return [ [ (random.randrange(n), random.random()) for _ in range(degree) ] for _ in range(n) ]
+
+def dijkstra_dary(graph, d):
+    dist = { 0: 0.0 }
+    heap = DaryHeap(d=d)
+    heap.heappush(0, 0.0)
+    while heap:
+        u = heap.heappop()
+        du = dist[u]
+        for v, w in graph[u]:
+            alt = du + w
+            if v not in dist:
+                dist[v] = alt
+                heap.heappush(v, alt)
+            elif alt < dist[v] and v in heap:
+                heap.decrease_key(v, alt)
+                dist[v] = alt
+    return dist
+
+def dijkstra_pairing(graph):
+    dist = { 0: 0.0 }
+    heap = PairingHeap()
+    entries = { 0: heap.heappush((0.0, 0)) }
+    while heap:
+        du, u = heap.heappop()
+        for v, w in graph[u]:
+            alt = du + w
+            if v not in dist:
+                dist[v] = alt
+                entries[v] = heap.heappush((alt, v))
+            elif alt < dist[v] and not entries[v].is_deleted:
+                entries[v].decrease_key((alt, v))
+                dist[v] = alt
+    return dist
+
+def timed(f, *args):
+    start = perf_counter()
+    result = f(*args)
+    return perf_counter() - start, result
+
+def main(n=100_000):
+    random.seed(0)
+    graph = random_graph(n)
+    keys = random.sample(range(n * 10), n)
+
+    t, expected = timed(dijkstra_pairing, graph)
+    print(f'{"PairingHeap":<12} dijkstra {t:.3f}s', end='')
+    t, _ = timed(lambda: [ heap.heappop() for heap in [ PairingHeap(keys) ] for _ in range(n) ])
+    print(f'    heapify + pop all {t:.3f}s')
+
+    for d in (2, 4, 8):
+        t, result = timed(dijkstra_dary, graph, d)
+        assert result == expected
+        print(f'{"DaryHeap d=" + str(d):<12} dijkstra {t:.3f}s', end='')
+        t, _ = timed(lambda: [ heap.heappop() for heap in [ DaryHeap(keys, d=d) ] for _ in range(n) ])
+        print(f'    heapify + pop all {t:.3f}s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,87 @@
+"""
+Producers putting n random floats and consumers getting them, through `ThreadHeapQueue` against
+`queue.PriorityQueue` (4 producer and 4 consumer threads) and `AsyncHeapQueue` against `asyncio.PriorityQueue`
+(4 producer and 4 consumer tasks).
+
+Usage: python -m benchmarks.heap_queue [n]
+"""
+import asyncio
+import queue
+import random
+import sys
+import threading
+from time import perf_counter
+
+from sacks.heaps import AsyncHeapQueue, FibonacciHeap, MeldableHeap, PairingHeap, ThreadHeapQueue
+
+WORKERS = 4
+DONE = float('inf')
+
+
+def run_threads(put, get, keys):
+    def produce(keys):
+        for key in keys:
+            put(key)
+
+    def consume():
+        while get() != DONE:
+            pass
+
+    consumers = [ threading.Thread(target=consume) for _ in range(WORKERS) ]
+    producers = [ threading.Thread(target=produce, args=(keys[i::WORKERS], )) for i in range(WORKERS) ]
+
+    start = perf_counter()
+    for thread in consumers + producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    for _ in range(WORKERS):
+        put(DONE)
+    for thread in consumers:
+        thread.join()
+    return perf_counter() - start
+
+async def run_tasks(put, get, keys):
+    async def produce(keys):
+        for i, key in enumerate(keys):
+            put(key)
+            if i % 64 == 0:
+                await asyncio.sleep(0)
+
+    async def consume():
+        while await get() != DONE:
+            pass
+
+    start = perf_counter()
+    consumers = [ asyncio.create_task(consume()) for _ in range(WORKERS) ]
+    await asyncio.gather(*(produce(keys[i::WORKERS]) for i in range(WORKERS)))
+    for _ in range(WORKERS):
+        put(DONE)
+    await asyncio.gather(*consumers)
+    return perf_counter() - start
+
+def main(n=200_000):
+    random.seed(0)
+    keys = [ random.random() for _ in range(n) ]
+
+    q = queue.PriorityQueue()
+    t = run_threads(q.put, q.get, keys)
+    print(f'{"queue.PriorityQueue":<40} {n / t:>10,.0f} items/s')
+
+    for heap in (PairingHeap, FibonacciHeap, MeldableHeap):
+        q = ThreadHeapQueue(heap())
+        t = run_threads(q.put, q.get, keys)
+        print(f'{"ThreadHeapQueue(" + heap.__name__ + ")":<40} {n / t:>10,.0f} items/s')
+
+    q = asyncio.PriorityQueue()
+    t = asyncio.run(run_tasks(q.put_nowait, q.get, keys))
+    print(f'{"asyncio.PriorityQueue":<40} {n / t:>10,.0f} items/s')
+
+    for heap in (PairingHeap, FibonacciHeap):
+        q = AsyncHeapQueue(heap())
+        t = asyncio.run(run_tasks(q.put, q.get, keys))
+        print(f'{"AsyncHeapQueue(" + heap.__name__ + ")":<40} {n / t:>10,.0f} items/s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
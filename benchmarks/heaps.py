@@ -0,0 +1,256 @@
+"""
+Compare every min-heap in `sacks.heaps` with `heapq` on:
+
+* push/pop mixes: a steady "hold" (pop a key, push a larger one) and growth (push two, pop one);
+* Dijkstra's algorithm on a sparse and a dense random graph, with lazy deletion (push duplicates, skip stale pops)
+  for every heap and with `decrease_key` for heaps that support it (`DaryHeap` pushes vertices with their
+  distances as priorities);
+* heap sort of random, sorted, reversed and organ-pipe keys, and of keys with few distinct values.
+
+Keys are non-negative ints (Dijkstra encodes (distance, vertex) as distance * n + vertex) so that `RadixHeap` can
+run every workload; heaps are popped in non-decreasing order throughout.  `QuantileHeap(0)` (whose quantile is the
+minimum) stands in for the list-based median heaps.  `DaryHeap` needs distinct keys, so it skips workloads with
+duplicates.  Each workload is timed, then run again under tracemalloc for its peak memory.
+
+Before timing, checks that FIFO heaps still pop equal keys in push order after a `merge`.
+
+See also `benchmarks.heap_queue` and `benchmarks.quantile_sketch`.
+
+Usage: python -m benchmarks.heaps [n]
+"""
+from heapq import heappop, heappush
+from operator import itemgetter
+import random
+import sys
+from time import perf_counter
+import tracemalloc
+
+from sacks.heaps import DaryHeap, FibonacciHeap, MeldableHeap, PairingHeap, QuantileHeap, RadixHeap
+
+
+class HeapQ:
+    """`heapq` on a list, with the interface of `sacks.heaps`.
+    """
+    __slots__ = '_heap',
+
+    def __init__(self):
+        self._heap = [ ]
+
+    def __len__(self):
+        return len(self._heap)
+
+    def heappush(self, key):
+        heappush(self._heap, key)
+
+    def heappop(self):
+        return heappop(self._heap)
+
+
+class MinQuantileHeap(QuantileHeap):
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(0)
+
+
+HEAPS = {
+    'heapq': HeapQ,
+    'DaryHeap': DaryHeap,
+    'FibonacciHeap': FibonacciHeap,
+    'MeldableHeap': MeldableHeap,
+    'PairingHeap': PairingHeap,
+    'QuantileHeap(0)': MinQuantileHeap,
+    'RadixHeap': RadixHeap,
+}
+DISTINCT_ONLY = { 'DaryHeap' }
+DECREASE_BY = { 'DaryHeap': 'item', 'FibonacciHeap': 'entry', 'PairingHeap': 'entry', 'RadixHeap': 'key' }
+
+
+# Pushed keys in `hold` and `grow` are `value * m + i` for the i-th push, so they are distinct.
+
+def hold(heap_type, increments):
+    """Push the first half of `increments`, then, for each of the rest, pop a key and push it plus the increment.
+    """
+    heap = heap_type()
+    m = len(increments)
+    half = m // 2
+    for i, increment in enumerate(increments[:half]):
+        heap.heappush(increment * m + i)
+
+    for i, increment in enumerate(increments[half:], half):
+        heap.heappush((heap.heappop() // m + increment) * m + i)
+
+    return half + 2 * (m - half)
+
+def grow(heap_type, increments):
+    """Push two keys and pop one for each pair of `increments`, pushing the last popped key plus each increment.
+    """
+    heap = heap_type()
+    m = len(increments)
+    last = 0
+    for i in range(0, m - 1, 2):
+        heap.heappush((last + increments[i]) * m + i)
+        heap.heappush((last + increments[i + 1]) * m + i + 1)
+        last = heap.heappop() // m
+
+    return 3 * (m // 2)
+
+def heap_sort(heap_type, keys):
+    heap = heap_type()
+    for key in keys:
+        heap.heappush(key)
+
+    result = [ heap.heappop() for _ in range(len(keys)) ]
+    assert result == sorted(keys)
+    return 2 * len(keys)
+
+def dijkstra_lazy(heap_type, graph):
+    n = len(graph)
+    dist = [ None ] * n
+    dist[0] = 0
+
+    heap = heap_type()
+    heap.heappush(0)
+    ops = 1
+    while heap:
+        d, u = divmod(heap.heappop(), n)
+        ops += 1
+        if d > dist[u]:
+            continue
+
+        for v, w in graph[u]:
+            alt = d + w
+            if dist[v] is None or alt < dist[v]:
+                dist[v] = alt
+                heap.heappush(alt * n + v)
+                ops += 1
+
+    return ops, dist
+
+def dijkstra_decrease(heap_type, graph, by):
+    """Dijkstra's algorithm decreasing keys `by` entry, by key (`decrease_key(old, new)`) or by item.
+    """
+    n = len(graph)
+    dist = [ None ] * n
+    dist[0] = 0
+
+    heap = heap_type()
+    entries = [ None ] * n
+    entries[0] = heap.heappush(0)
+    done = [ False ] * n
+    ops = 1
+    while heap:
+        if by == 'item':
+            u = heap.heappop()
+            d = dist[u]
+        else:
+            d, u = divmod(heap.heappop(), n)
+        done[u] = True
+        ops += 1
+
+        for v, w in graph[u]:
+            alt = d + w
+            if dist[v] is None:
+                dist[v] = alt
+                if by == 'item':
+                    heap.heappush(v, alt)
+                else:
+                    entries[v] = heap.heappush(alt * n + v)
+            elif alt < dist[v] and not done[v]:
+                if by == 'entry':
+                    entries[v].decrease_key(alt * n + v)
+                elif by == 'key':
+                    heap.decrease_key(dist[v] * n + v, alt * n + v)
+                else:
+                    heap.decrease_key(v, alt)
+                dist[v] = alt
+            else:
+                continue
+            ops += 1
+
+    return ops, dist
+
+def fifo_merge(heap_type):
+    """Merge a heap of equal keys into another, push one more equal key, and check they pop in push order.
+    """
+    key = itemgetter(0)
+    a, b = heap_type(key=key, fifo=True), heap_type(key=key, fifo=True)
+    for i in range(5):
+        b.heappush((1, f'b{i}'))
+
+    a.merge(b)
+    a.heappush((1, 'new'))
+
+    result = [ a.heappop()[1] for _ in range(len(a)) ]
+    assert result == [ 'b0', 'b1', 'b2', 'b3', 'b4', 'new' ], f'{heap_type.__name__}: {result}'
+
+def random_graph(n, degree):
+    return [ [ (random.randrange(n), random.randrange(1, 1000)) for _ in range(degree) ] for _ in range(n) ]
+
+def measure(f, *args):
+    """Return the seconds `f` takes, its result, and its peak memory (from a second run under tracemalloc).
+    """
+    start = perf_counter()
+    result = f(*args)
+    elapsed = perf_counter() - start
+
+    tracemalloc.start()
+    f(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, result, peak
+
+def report(workload, name, elapsed, ops, peak):
+    print(f'{workload:<24} {name:<16} {elapsed:>8.3f}s {ops / elapsed:>12,.0f} ops/s {peak / 2**20:>9.2f} MiB')
+
+def main(n=50_000):
+    random.seed(0)
+    increments = [ random.randrange(1, 1000) for _ in range(n) ]
+    distinct = random.sample(range(n * 10), n)
+    ordered = sorted(distinct)
+    sort_inputs = {
+        'random': distinct,
+        'sorted': ordered,
+        'reversed': ordered[::-1],
+        'organ-pipe': ordered[::2] + ordered[1::2][::-1],
+        'few distinct': [ random.randrange(10) for _ in range(n) ],
+    }
+    graphs = {
+        'sparse': random_graph(n // 4, 8),
+        'dense': random_graph(int(n**.5) * 2, int(n**.5)),
+    }
+
+    for heap_type in (FibonacciHeap, MeldableHeap, PairingHeap):
+        fifo_merge(heap_type)
+
+    print(f'{"workload":<24} {"heap":<16} {"time":>9} {"ops/s":>16} {"peak":>13}')
+    for name, heap_type in HEAPS.items():
+        for workload, f in (('hold', hold), ('grow', grow)):
+            elapsed, ops, peak = measure(f, heap_type, increments)
+            report(workload, name, elapsed, ops, peak)
+
+    for order, keys in sort_inputs.items():
+        for name, heap_type in HEAPS.items():
+            if name in DISTINCT_ONLY and len(set(keys)) < len(keys):
+                continue
+
+            elapsed, ops, peak = measure(heap_sort, heap_type, keys)
+            report(f'heap sort {order}', name, elapsed, ops, peak)
+
+    for density, graph in graphs.items():
+        expected = None
+        for name, heap_type in HEAPS.items():
+            elapsed, (ops, dist), peak = measure(dijkstra_lazy, heap_type, graph)
+            assert expected is None or dist == expected
+            expected = dist
+            report(f'dijkstra {density} lazy', name, elapsed, ops, peak)
+
+        for name, heap_type in HEAPS.items():
+            if name in DECREASE_BY:
+                elapsed, (ops, dist), peak = measure(dijkstra_decrease, heap_type, graph, DECREASE_BY[name])
+                assert dist == expected
+                report(f'dijkstra {density} decr.', name, elapsed, ops, peak)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,32 @@
+"""
+Push n random keys onto a PairingHeap, then pop them all.
+
+Usage: python -m benchmarks.pairing_heap [n ...]
+"""
+import random
+import sys
+from time import perf_counter
+
+from sacks.heaps import PairingHeap
+
+
+def main(*ns):
+    random.seed(0)
+
+    for n in ns or (10_000, 200_000):
+        keys = [ random.random() for _ in range(n) ]
+        heap = PairingHeap()
+
+        start = perf_counter()
+        for key in keys:
+            heap.heappush(key)
+        pushed = perf_counter()
+        for _ in range(n):
+            heap.heappop()
+        popped = perf_counter()
+
+        print(f'n = {n:<10} push {pushed - start:.3f}s    pop {popped - pushed:.3f}s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
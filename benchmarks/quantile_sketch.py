@@ -0,0 +1,65 @@
+"""
+Median of n random floats with `QuantileSketch` (one `add` at a time, `add_many`, and four sketches merged) and
+`MedianHeap`: time, peak memory and rank error of the median.
+
+Usage: python -m benchmarks.quantile_sketch [n] [k]
+"""
+from bisect import bisect_left
+import random
+import sys
+from time import perf_counter
+import tracemalloc
+
+from sacks.heaps import MedianHeap, QuantileSketch
+
+
+def add_each(data, k):
+    sketch = QuantileSketch(k=k)
+    for item in data:
+        sketch.add(item)
+    return sketch.quantile(.5)
+
+def add_many(data, k):
+    return QuantileSketch(data, k=k).quantile(.5)
+
+def merged(data, k):
+    sketch, *others = (QuantileSketch(data[i::4], k=k) for i in range(4))
+    for other in others:
+        sketch.merge(other)
+    return sketch.quantile(.5)
+
+def median_heap(data, k):
+    heap = MedianHeap()
+    for item in data:
+        heap.heappush(item)
+    return heap.median
+
+def measure(f, *args):
+    """Time `f` and then run it again under tracemalloc (which slows it down) for its peak memory.
+    """
+    start = perf_counter()
+    result = f(*args)
+    elapsed = perf_counter() - start
+
+    tracemalloc.start()
+    f(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+def main(n=1_000_000, k=200):
+    random.seed(0)
+    data = [ random.random() for _ in range(n) ]
+    ordered = sorted(data)
+
+    for name, f in [ ('add', add_each), ('add_many', add_many), ('merge x4', merged), ('MedianHeap', median_heap) ]:
+        elapsed, peak, median = measure(f, data, k)
+        error = abs(bisect_left(ordered, median) - (n - 1) // 2) / n
+        print(f'{name:<12} {elapsed:.3f}s    peak {peak / 2**20:8.2f} MiB    rank error {error:.4%}')
+
+    sketch = QuantileSketch(data, k=k)
+    print(f'QuantileSketch(k={k}) holds {sketch._size} items, {len(sketch.to_bytes())} bytes serialized')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,61 @@
+"""
+Repeated inserts into a Rope at one spot and at random spots, one `insert` at a time and as a single `apply_edits`
+batch.  Checks the rope's height stays O(log n) without calling `rebalance`, and that edits of the wrong type are
+refused before the rope is touched.
+
+See also `benchmarks.rope_nodes`.
+
+Usage: python -m benchmarks.rope [n]
+"""
+from math import log2
+import random
+import sys
+from time import perf_counter
+
+from sacks.sequences import Rope
+
+
+def one_spot(rope, n):
+    middle = len(rope) // 2
+    for _ in range(n):
+        rope.insert(middle, 'xyz')
+
+def random_spots(rope, n):
+    for _ in range(n):
+        rope.insert(random.randrange(len(rope)), 'xyz')
+
+def batched(rope, n):
+    rope.apply_edits([ (i, i, 'xyz') for i in random.sample(range(len(rope)), n) ])
+
+def wrong_type():
+    rope = Rope('abcdef')
+    try:
+        rope[0:2] = [ 1, 2 ]
+    except TypeError:
+        pass
+    else:
+        raise AssertionError('list assigned into a str rope')
+
+    assert str(rope) == 'abcdef' and len(rope) == 6
+
+def main(n=10_000):
+    random.seed(0)
+    wrong_type()
+
+    for name, f in (('one spot', one_spot), ('random spots', random_spots), ('apply_edits', batched)):
+        rope = Rope('a' * 2 * n)
+
+        start = perf_counter()
+        f(rope, n)
+        elapsed = perf_counter() - start
+
+        # Leaves hold at least one item, so an AVL-balanced rope of len(rope) items is at most ~1.44 log2 high.
+        height, bound = rope.root.height, 1.45 * log2(len(rope)) + 2
+        assert height <= bound, f'{name}: height {height} > {bound:.0f}'
+        assert len(rope) == len(str(rope)) == 5 * n
+
+        print(f'{name:<14} {elapsed:.3f}s    height {height}')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,78 @@
+"""
+Build a Rope of n random characters, split it into pieces at random indexes and join the pieces back together,
+timing each step (best of 3) and measuring the peak memory of the build.  Checks the rejoined rope matches the text.
+
+Only uses the `Rope` API that predates the current node layout (parent, side and subtree length stored on each
+node), so running this on an older checkout gives the numbers to compare against.
+
+See also `benchmarks.rope`.
+
+Usage: python -m benchmarks.rope_nodes [n] [pieces]
+"""
+import random
+import sys
+from time import perf_counter
+import tracemalloc
+
+from sacks.sequences import Rope
+
+REPEATS = 3
+
+
+def build(text):
+    return Rope(text)
+
+def split(rope, indexes):
+    """Split `rope` at each of `indexes` (in decreasing order).  Return the pieces in order.
+    """
+    pieces = [ ]
+    for i in indexes:
+        rope, piece = rope.split(i)
+        pieces.append(piece)
+
+    pieces.append(rope)
+    return pieces[::-1]
+
+def join(pieces):
+    rope = pieces[0]
+    for piece in pieces[1:]:
+        rope.join(piece)
+
+    return rope
+
+def best(f, setup):
+    """Return the least time of `REPEATS` calls of `f(*setup())` and the last result.
+    """
+    times = [ ]
+    for _ in range(REPEATS):
+        args = setup()
+        start = perf_counter()
+        result = f(*args)
+        times.append(perf_counter() - start)
+
+    return min(times), result
+
+def main(n=200_000, pieces=100):
+    random.seed(0)
+    text = ''.join(random.choice('abcdefgh') for _ in range(n))
+    indexes = sorted(random.sample(range(1, n), pieces - 1), reverse=True)
+
+    tracemalloc.start()
+    build(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    elapsed, _ = best(build, lambda: (text,))
+    print(f'{"build":<8} {elapsed:>8.3f}s {peak / 2**20:>9.2f} MiB')
+
+    elapsed, _ = best(split, lambda: (Rope(text), indexes))
+    print(f'{"split":<8} {elapsed:>8.3f}s    {pieces} pieces')
+
+    elapsed, rope = best(join, lambda: (split(Rope(text), indexes),))
+    print(f'{"join":<8} {elapsed:>8.3f}s    {pieces} pieces')
+
+    assert len(rope) == n and str(rope) == text
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -1,4 +1,8 @@
+from .d_ary_heap import DaryHeap
 from .fibonacci_heap import FibonacciHeap
-from .median_heap import MedianHeap
+from .heap_queue import AsyncHeapQueue, ThreadHeapQueue
+from .median_heap import MedianHeap, QuantileHeap, SlidingMedian
 from .meld_heap import MeldableHeap
 from .pairing_heap import PairingHeap
+from .quantile_sketch import QuantileSketch
+from .radix_heap import RadixHeap
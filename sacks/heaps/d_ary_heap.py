@@ -0,0 +1,318 @@
+from heapq import heappop, heappush
+
+from .heap import Heap, Entry, DeletedEntryError
+
+
+class ItemEntry(Entry):
+    """An entry of a heap indexed by item.  (`_node` is the entry's item.)
+    """
+    __slots__ = ()
+
+    @property
+    def is_deleted(self):
+        return not hasattr(self, '_node') or self._node not in self._heap
+
+    @property
+    def key(self):
+        if self.is_deleted:
+            raise DeletedEntryError("entry deleted")
+
+        return self._heap.priority(self._node)
+
+    @property
+    def item(self):
+        if self.is_deleted:
+            raise DeletedEntryError("entry deleted")
+
+        return self._node
+
+    def delete(self):
+        if self.is_deleted:
+            raise DeletedEntryError("entry already deleted")
+
+        self._heap.remove(self._node)
+        del self._node
+        del self._token
+
+
+class DaryHeap(Heap):
+    """
+    An array-backed heap in which each node has `d` children.  Items are kept in one array and their priorities in
+    another, with a map from each item to its position, so containment is O(1) and `decrease_key`, `increase_key`
+    and `remove` by item are O(log n).
+
+    An item's priority is given when it's pushed, or else is `key(item)` (the item itself if `key` is None).  Items
+    must be hashable and distinct; priorities needn't be.
+
+    Notes
+    -----
+    Wider nodes make the heap shallower, so pushes and decreases (which sift up) do fewer comparisons at the cost
+    of more comparisons per level when popping.  d = 4 is usually fastest.
+
+    For graph search, push vertices with their distances as priorities and decrease a vertex's distance with
+    `decrease_key(vertex, distance)`; only priorities are compared.
+
+    """
+    __slots__ = '_items', '_priorities', '_index', '_d',
+
+    def __init__(self, iterable=(), key=None, *, d=4):
+        if d < 2:
+            raise ValueError('d must be at least 2')
+
+        self._items = [ ]
+        self._priorities = [ ]
+        self._index = { }
+        self._d = d
+
+        super().__init__(iterable, key)
+
+    @property
+    def d(self):
+        return self._d
+
+    @property
+    def min(self):
+        if not self._items:
+            raise IndexError('empty heap')
+
+        return self._items[0]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return item in self._index
+
+    def _priority(self, item, priority):
+        if priority is not None:
+            return priority
+
+        return item if self._key is None else self._key(item)
+
+    def priority(self, item):
+        """Return the priority of `item`.
+        """
+        return self._priorities[self._index[item]]
+
+    def entry(self, item):
+        """Return an entry for `item`.
+        """
+        if item not in self._index:
+            raise KeyError(item)
+
+        return ItemEntry(item, self)
+
+    def _sift_up(self, i):
+        items, priorities, index, d = self._items, self._priorities, self._index, self._d
+
+        item, priority = items[i], priorities[i]
+        while i:
+            parent = (i - 1) // d
+            parent_priority = priorities[parent]
+            if not priority < parent_priority:
+                break
+
+            parent_item = items[parent]
+            items[i], priorities[i] = parent_item, parent_priority
+            index[parent_item] = i
+            i = parent
+
+        items[i], priorities[i] = item, priority
+        index[item] = i
+
+    def _sift_down(self, i):
+        items, priorities, index, d = self._items, self._priorities, self._index, self._d
+        n = len(items)
+
+        item, priority = items[i], priorities[i]
+        while (first := d * i + 1) < n:
+            child, child_priority = first, priorities[first]
+            for j in range(first + 1, min(first + d, n)):
+                if priorities[j] < child_priority:
+                    child, child_priority = j, priorities[j]
+
+            if not child_priority < priority:
+                break
+
+            child_item = items[child]
+            items[i], priorities[i] = child_item, child_priority
+            index[child_item] = i
+            i = child
+
+        items[i], priorities[i] = item, priority
+        index[item] = i
+
+    def heappush(self, item, priority=None):
+        if item in self._index:
+            raise ValueError(f'{item!r} already in heap')
+
+        self._items.append(item)
+        self._priorities.append(self._priority(item, priority))
+        self._sift_up(len(self._items) - 1)
+
+    def heappop(self):
+        items, priorities = self._items, self._priorities
+        if not items:
+            raise IndexError('pop from empty heap')
+
+        last, last_priority = items.pop(), priorities.pop()
+        if not items:
+            del self._index[last]
+            return last
+
+        result = items[0]
+        del self._index[result]
+
+        items[0], priorities[0] = last, last_priority
+        self._sift_down(0)
+        return result
+
+    def heapify(self, iterable):
+        items, priorities, index = self._items, self._priorities, self._index
+
+        n = len(items)
+        for item in iterable:
+            if item in index:
+                for added in items[n:]:
+                    del index[added]
+                del items[n:], priorities[n:]
+
+                raise ValueError(f'{item!r} already in heap')
+
+            index[item] = len(items)
+            items.append(item)
+            priorities.append(self._priority(item, None))
+
+        self._restore(n)
+
+    def _restore(self, n):
+        """Restore the heap invariant after items were appended from position `n` on.
+        """
+        size = len(self._items)
+        if (size - n) * n.bit_length() < n:
+            # Few items were added to a large heap: sifting each up is cheaper than rebuilding.
+            for i in range(n, size):
+                self._sift_up(i)
+        else:
+            for i in reversed(range((size + self._d - 2) // self._d)):
+                self._sift_down(i)
+
+    def push_many(self, iterable):
+        self.heapify(iterable)
+
+    def pushpop(self, item, priority=None):
+        priority = self._priority(item, priority)
+        if not self._items or not self._priorities[0] < priority:
+            return item
+
+        return self.replace(item, priority)
+
+    def replace(self, item, priority=None):
+        items, index = self._items, self._index
+        if not items:
+            raise IndexError('replace on empty heap')
+
+        result = items[0]
+        del index[result]
+
+        if item in index:
+            index[result] = 0
+            raise ValueError(f'{item!r} already in heap')
+
+        items[0], self._priorities[0] = item, self._priority(item, priority)
+        self._sift_down(0)
+        return result
+
+    def nsmallest(self, k):
+        items, priorities, d = self._items, self._priorities, self._d
+        n = len(items)
+
+        # Positions break ties, so items are never compared.
+        frontier = [ (priorities[0], 0) ] if items else [ ]
+        least = [ ]
+        while frontier and len(least) < k:
+            _, i = heappop(frontier)
+            least.append(items[i])
+            for j in range(d * i + 1, min(d * i + d + 1, n)):
+                heappush(frontier, (priorities[j], j))
+
+        return least
+
+    def decrease_key(self, item, priority):
+        """
+        Lower the priority of `item` to `priority`.
+
+        Raises
+        ------
+        KeyError if `item` isn't in the heap.
+
+        ValueError if `priority` is greater than the priority of `item`.
+
+        """
+        i = self._index[item]
+        if self._priorities[i] < priority:
+            raise ValueError(f'{priority!r} greater than {self._priorities[i]!r}')
+
+        self._priorities[i] = priority
+        self._sift_up(i)
+
+    def increase_key(self, item, priority):
+        """
+        Raise the priority of `item` to `priority`.
+
+        Raises
+        ------
+        KeyError if `item` isn't in the heap.
+
+        ValueError if `priority` is less than the priority of `item`.
+
+        """
+        i = self._index[item]
+        if priority < self._priorities[i]:
+            raise ValueError(f'{priority!r} less than {self._priorities[i]!r}')
+
+        self._priorities[i] = priority
+        self._sift_down(i)
+
+    def remove(self, item):
+        """
+        Remove `item` from the heap.
+
+        Raises
+        ------
+        KeyError if `item` isn't in the heap.
+
+        """
+        i = self._index.pop(item)
+        priority = self._priorities[i]
+
+        last, last_priority = self._items.pop(), self._priorities.pop()
+        if i == len(self._items):
+            return
+
+        self._items[i], self._priorities[i] = last, last_priority
+        if last_priority < priority:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def _merge(self, other):
+        for item in other._items:
+            if item in self._index:
+                raise ValueError(f'{item!r} already in heap')
+
+        n = len(self._items)
+        self._items += other._items
+        self._priorities += other._priorities
+        self._index.update((item, n + i) for i, item in enumerate(other._items))
+        self._restore(n)
+
+        other._items = [ ]
+        other._priorities = [ ]
+        other._index = { }
+
+    def __repr__(self):
+        return f'{type(self).__name__}[size={len(self)}, d={self._d}]'
+
+    def __str__(self):
+        return str(list(zip(self._items, self._priorities)))
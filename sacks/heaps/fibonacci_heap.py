@@ -1,5 +1,9 @@
-from .heap import Heap, Entry
-from ..primitives.fibonnaci_heap_node import FibHeapNode
+from math import log
+
+from .heap import Heap, Entry, best_first
+from ..primitives.fibonnaci_heap_node import FibHeapNode, FifoFibHeapNode
+
+PHI = (1 + 5**.5) / 2
 
 def merge_lists(a, b):
     """Merge two linked lists and return the least node.
@@ -17,64 +21,197 @@ def merge_lists(a, b):
 
     return min(a, b)
 
-def merge_trees(trees):
-    """Merge trees in a linked list until each has a different degree.  Return the min tree.
+def link(nodes):
+    """Link `nodes` into a circular list.
+    """
+    for prev, node in zip(nodes, nodes[1:] + nodes[:1]):
+        prev.next = node
+        node.prev = prev
+
+def merge_trees(first, size):
     """
-    degree_table = { }
+    Link trees in the root list at `first` until each has a different degree.  Return the min tree.
+
+    Notes
+    -----
+    A tree of degree d has at least phi**d nodes, so degrees of a heap with `size` nodes are at most log_phi(size)
+    and the degree table is a list of that length.  The root list is walked in place: only trees already visited
+    are linked under others, so the next tree to visit is always still in the list.
 
-    for root in tuple(trees):
-        while True:
-            if root.degree not in degree_table:
-                degree_table[root.degree] = root
-                break
+    """
+    degrees = [ None ] * (int(log(size, PHI)) + 2)
+    least = None
+    last = first.prev
 
-            child = degree_table.pop(root.degree)
-            if root > child:
-                root, child = child, root
-            root.add_child(child)
+    node = first
+    while True:
+        following = node.next
 
-    return min(root)
+        root, degree = node, node.degree
+        while (other := degrees[degree]) is not None:
+            degrees[degree] = None
+            if root > other:
+                root, other = other, root
+            root.add_child(other)
+            degree += 1
+
+        degrees[degree] = root
+        if least is None or not least < root:
+            least = root
+
+        if node is last:
+            return least
+
+        node = following
 
 
 class FibonacciHeap(Heap):
     """
     A priority queue consisting of heap-ordered trees.
 
+    Warning
+    -------
+    If `recycle` is true, popped nodes are kept on a free-list and reused by later pushes, and `heappush` returns
+    None instead of an Entry (which could otherwise outlive its node).  A popped node is only kept while the
+    free-list is shorter than the heap, so the free-list never outgrows the heap's peak size.
+
     References
     ----------
     [https://en.wikipedia.org/wiki/Fibonacci_heap]
 
     """
-    def heappush(self, key):
-        node = FibHeapNode(key)
+    __slots__ = '_free',
+
+    _node_type = FibHeapNode
+    _fifo_node_type = FifoFibHeapNode
+
+    def __init__(self, iterable=(), key=None, fifo=False, *, recycle=False):
+        self._free = [ ] if recycle else None
+
+        super().__init__(iterable, key, fifo)
+
+    def _make_node(self, item):
+        """Return a node for `item`, reusing a free node if there is one.
+        """
+        if not self._free:
+            return self._new_node(item)
+
+        node = self._free.pop()
+        node.reset(item if self._key is None else self._key(item))
+        self._tag(node, item)
+        return node
+
+    def heappush(self, item):
+        node = self._make_node(item)
         self._root = merge_lists(self._root, node)
         self._size += 1
-        return Entry(node, self)
+
+        if self._free is None:
+            return Entry(node, self)
+
+    def _merge(self, other):
+        if self._free is not None and other._free is None:
+            raise ValueError('cannot merge a heap with entries into a recycling heap')
+
+        self._root = merge_lists(self._root, other._root)
+        self._size += other._size
+
+    def heapify(self, iterable):
+        self._add_roots([ self._new_node(item) for item in iterable ])
+
+    def push_many(self, iterable):
+        """Push all items of `iterable` as one list of roots.  Return a list of their entries (None if recycling).
+        """
+        nodes = [ self._new_node(item) for item in iterable ]
+        self._add_roots(nodes)
+
+        if self._free is None:
+            return [ Entry(node, self) for node in nodes ]
+
+    def _add_roots(self, nodes):
+        if not nodes:
+            return
+
+        link(nodes)
+        self._root = merge_lists(self._root, min(nodes))
+        self._size += len(nodes)
+
+    def _tops(self):
+        return () if self._root is None else iter(self._root)
+
+    @staticmethod
+    def _children(node):
+        return () if node.children is None else node.children
+
+    def pop_many(self, k):
+        """
+        Pop the `k` smallest keys (or every key if there are fewer) and return them in order.
+
+        Notes
+        -----
+        The smallest nodes are found by a best-first search over the root list.  The roots left behind are relinked and
+        consolidated once, instead of once per pop.
+
+        """
+        least, frontier = best_first(self._tops(), self._children, k)
+
+        for node in frontier:
+            node.parent = None
+            node.marked = False
+        link(frontier)
+
+        items = [ self._item(node) for node in least ]
+        for node in least:
+            node.next = node.prev = node.children = None
+            if self._free is not None:
+                self._recycle(node)
+
+        self._size -= len(least)
+        self._root = merge_trees(frontier[0], self._size) if frontier else None
+        return items
+
+    def _cut_root(self):
+        """Remove the min root.  Return its item and a node of the list of the other roots and its children.
+        """
+        root = self._root
+        roots = None if root.next is root else root.next
+        children = root.children
+
+        root.pop()
+        result = self._item(root)
+        if self._free is not None:
+            self._recycle(root)
+
+        if children is not None:
+            for child in children:
+                child.parent = None
+
+        return result, merge_lists(roots, children)
 
     def heappop(self):
         if not self:
             raise IndexError('pop from empty heap')
 
-        if self._root.next is self._root:
-            roots = None
-        else:
-            roots = self._root.next
-
-        result = self._root.key
-        self._root.pop()
+        result, roots = self._cut_root()
 
         self._size -= 1
-        if self._size == 0:
-            self._root = None
-        else:
-            if children := self._root.children:
-                for root in children:
-                    root.parent = None
+        self._root = None if roots is None else merge_trees(roots, self._size)
+        return result
 
-            self._root = merge_trees(merge_lists(roots, children))
+    def replace(self, item):
+        if not self:
+            raise IndexError('replace on empty heap')
 
+        # The new node is consolidated with the other roots, so a popped node is reused straight away if recycling.
+        result, roots = self._cut_root()
+        self._root = merge_trees(merge_lists(roots, self._make_node(item)), self._size)
         return result
 
+    def _recycle(self, node):
+        if len(self._free) < self._size:
+            node.key = node.item = None
+            self._free.append(node)
+
     def decrease_key(self, node, key):
         node.key = key
 
@@ -95,6 +232,8 @@ class FibonacciHeap(Heap):
         else:
             node.parent.children = node.next
 
+        node.parent.degree -= 1
+
         node.marked = False
         node.parent = None
         node.remove()
@@ -1,5 +1,10 @@
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Sized
+from heapq import heapify as heapify_list
+from heapq import heappop as heappop_list
+from heapq import heappush as heappush_list
+from itertools import count
 
 from ..primitives.sentinel import sentinel
 
@@ -14,16 +19,114 @@ NEG_INF = sentinel(
     },
 )
 
+def meld_pairwise(trees, meld):
+    """
+    Meld a list of heap-ordered trees by repeatedly melding the first two trees in a queue and appending the result.
+    Return the final tree or None if there are no trees.
+    """
+    queue = deque(trees)
+    while len(queue) > 1:
+        queue.append(meld(queue.popleft(), queue.popleft()))
+
+    return queue[0] if queue else None
+
+def best_first(tops, children, k):
+    """
+    Find the `k` least nodes of a heap-ordered forest with roots `tops` by a best-first search.  Return them in
+    order, along with the frontier: the nodes left that are roots once the `k` least nodes are removed.
+
+    Notes
+    -----
+    Only the found nodes and their children are visited, so this is O(r + k * c * log(r + k * c)) for r roots and
+    nodes with at most c children.
+    """
+    frontier = list(tops)
+    heapify_list(frontier)
+
+    least = [ ]
+    while frontier and len(least) < k:
+        node = heappop_list(frontier)
+        least.append(node)
+        for child in children(node):
+            heappush_list(frontier, child)
+
+    return least, frontier
+
+
+class HeapToken:
+    """
+    A reference to a heap held by entries.  When a heap is merged into another, its token forwards to the other
+    heap's token, so entries always find the heap that currently holds their node.
+    """
+    __slots__ = 'heap', 'forward',
+
+    def __init__(self, heap):
+        self.heap = heap
+        self.forward = None
+
+    def resolve(self):
+        """Return the heap this token refers to, compressing the forwarding chain.
+        """
+        token = self
+        while token.forward is not None:
+            token = token.forward
+
+        current = self
+        while current.forward is not None:
+            current.forward, current = token, current.forward
+
+        return token.heap
+
+
+# Insertion order shared by every FIFO heap, so that merged heaps stay in push order.
+ORDER = count()
+
 
 class Heap(ABC, Sized):
-    __slots__ = '_size', '_root',
+    """
+    Base for heaps of nodes.
+
+    If `key` is given, nodes are ordered by `key(item)` (computed once, when an item is pushed) and hold the item
+    alongside.  If `fifo` is true, items with equal keys are popped in the order they were pushed.
+    """
+    __slots__ = '_size', '_root', '_token', '_key', '_order',
+
+    _node_type = None
+    _fifo_node_type = None
 
-    def __init__(self, iterable=()):
+    def __init__(self, iterable=(), key=None, fifo=False):
         self._root = None
         self._size = 0
+        self._token = HeapToken(self)
+        self._key = key
+        self._order = ORDER if fifo else None
 
-        for item in iterable:
-            self.heappush(item)
+        self.heapify(iterable)
+
+    def _new_node(self, item):
+        """Return a new node for `item`.
+        """
+        if self._key is None and self._order is None:
+            return self._node_type(item)
+
+        node_type = self._node_type if self._order is None else self._fifo_node_type
+        node = node_type(item if self._key is None else self._key(item))
+        self._tag(node, item)
+        return node
+
+    def _tag(self, node, item):
+        """Store `item` and the next insertion order on `node` as needed.
+        """
+        if self._key is not None:
+            node.item = item
+
+        if self._order is not None:
+            node.order = next(self._order)
+
+    def _item(self, node):
+        """Return the item held by `node`.
+        """
+        return node.key if self._key is None else node.item
 
     @property
     def root(self):
@@ -42,12 +145,108 @@ class Heap(ABC, Sized):
         """Push item onto heap, maintaining the heap invariant.
         """
 
+    def heapify(self, iterable):
+        """Push all items of `iterable` onto the heap.  Subclasses override this with a linear-time build.
+        """
+        for item in iterable:
+            self.heappush(item)
+
+    def pushpop(self, item):
+        """Push `item` and then pop the smallest item.  Faster than `heappush` followed by `heappop`.
+        """
+        if not self:
+            return item
+
+        key = item if self._key is None else self._key(item)
+        least = self._root.key
+        if key < least or self._order is None and not least < key:
+            return item
+
+        return self.replace(item)
+
+    def replace(self, key):
+        """
+        Pop the smallest key and then push `key`.  Node heaps override this to add `key` while restoring the heap
+        after the pop.
+
+        Raises
+        ------
+        IndexError if the heap is empty.
+
+        """
+        result = self.heappop()
+        self.heappush(key)
+        return result
+
+    def push_many(self, iterable):
+        """Push all items of `iterable`.  Return a list of their entries if this heap's `heappush` returns entries.
+        """
+        return [ self.heappush(item) for item in iterable ]
+
+    def pop_many(self, k):
+        """Pop the `k` smallest keys (or every key if there are fewer) and return them in order.
+        """
+        return [ self.heappop() for _ in range(min(k, len(self))) ]
+
+    def _tops(self):
+        """Return the roots of the heap's trees.
+        """
+        return () if self._root is None else (self._root, )
+
+    @staticmethod
+    def _children(node):
+        return node.children
+
+    def nsmallest(self, k):
+        """Return the `k` smallest keys (or every key if there are fewer) in order, without popping them.
+        """
+        least, _ = best_first(self._tops(), self._children, k)
+        return [ self._item(node) for node in least ]
+
+    @abstractmethod
+    def _merge(self, other):
+        """
+        Move the items of `other`, a heap of the same type, into this heap.  `merge` checks `other` beforehand and
+        then resets it and forwards its entries to this heap.
+        """
+
+    def merge(self, other):
+        """
+        Move all items of `other` into this heap.  Entries of `other` remain valid and now refer to this heap.
+
+        Warning
+        -------
+        This is destructive.  `other` will be empty afterwards.
+
+        Raises
+        ------
+        TypeError if `other` isn't the same type of heap, or has a different key function or tie-breaking.
+
+        """
+        if type(other) is not type(self):
+            raise TypeError(f'cannot merge {type(other).__name__} into {type(self).__name__}')
+
+        if other._key is not self._key or (other._order is None) is not (self._order is None):
+            raise TypeError('cannot merge heaps with different key functions or tie-breaking')
+
+        if other is self:
+            return
+
+        self._merge(other)
+
+        other._token.heap = None
+        other._token.forward = self._token
+
+        other._root = None
+        other._size = 0
+        other._token = HeapToken(other)
+
     @property
     def min(self):
         if not self:
             raise IndexError('empty heap')
 
-        return self._root.key
+        return self._item(self._root)
 
 
 class DeletedEntryError(Exception):
@@ -59,15 +258,19 @@ class DeletedEntryError(Exception):
 class Entry:
     """An interface for decreasing/deleting a key in a heap. (Tree nodes will stay private.)
     """
-    __slots__ = '_node', '_heap',
+    __slots__ = '_node', '_token',
 
     def __init__(self, node, heap):
         self._node = node
-        self._heap = heap
+        self._token = heap._token
+
+    @property
+    def _heap(self):
+        return self._token.resolve()
 
     @property
     def is_deleted(self):
-        return not hasattr(self, '_node') or not self._node.next
+        return not hasattr(self, '_node') or self._node.is_deleted
 
     @property
     def key(self):
@@ -76,6 +279,13 @@ class Entry:
 
         return self._node.key
 
+    @property
+    def item(self):
+        if self.is_deleted:
+            raise DeletedEntryError("entry deleted")
+
+        return self._heap._item(self._node)
+
     def decrease_key(self, key):
         if self.is_deleted:
             raise DeletedEntryError("entry deleted")
@@ -92,7 +302,7 @@ class Entry:
         self.decrease_key(NEG_INF)
         self._heap.heappop()
         del self._node
-        del self._heap
+        del self._token
 
     def __repr__(self):
         key = 'DELETED' if self.is_deleted else repr(self.key)
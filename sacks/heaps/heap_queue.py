@@ -0,0 +1,251 @@
+import asyncio
+from collections import deque
+from queue import Empty
+from threading import Condition
+
+from .d_ary_heap import DaryHeap
+from .pairing_heap import PairingHeap
+
+
+def reprioritize(heap, entry, key):
+    """
+    Change the key of `entry` in `heap` to `key`.  Return the item's entry: `entry` itself if `key` isn't greater
+    or `heap` is a DaryHeap (whose entries follow their item), else a new entry.
+
+    Raises
+    ------
+    ValueError if `key` is greater and `heap` has a key function (and isn't a DaryHeap).
+
+    """
+    if not key > entry.key:
+        entry.decrease_key(key)
+        return entry
+
+    if isinstance(heap, DaryHeap):
+        heap.increase_key(entry.item, key)
+        return entry
+
+    if heap._key is not None:
+        raise ValueError('cannot increase a key computed by a key function')
+
+    entry.delete()
+    return heap.heappush(key)
+
+
+class ThreadHeapQueue:
+    """
+    A thread-safe priority queue over a heap (a new `PairingHeap` by default).  `get` blocks until the queue is
+    non-empty.
+
+    Notes
+    -----
+    Entries returned by `put` must only be changed through `reprioritize` and `remove`, which hold the queue's lock.
+    The heap itself shouldn't be used directly while the queue is shared.
+
+    """
+    __slots__ = '_heap', '_not_empty',
+
+    def __init__(self, heap=None):
+        self._heap = PairingHeap() if heap is None else heap
+        self._not_empty = Condition()
+
+    def __len__(self):
+        with self._not_empty:
+            return len(self._heap)
+
+    def put(self, key):
+        """Put `key` in the queue and return its entry (if the heap returns entries).
+        """
+        with self._not_empty:
+            entry = self._heap.heappush(key)
+            self._not_empty.notify()
+            return entry
+
+    def put_many(self, keys):
+        """Put each of `keys` in the queue and return their entries (if the heap returns entries).
+        """
+        with self._not_empty:
+            entries = self._heap.push_many(keys)
+            self._not_empty.notify(len(self._heap))
+            return entries
+
+    def get(self, block=True, timeout=None):
+        """
+        Remove and return the smallest key.  If `block` is true, wait up to `timeout` seconds (forever if None) for
+        one.
+
+        Raises
+        ------
+        queue.Empty if there's no key to return.
+
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._heap.__len__, timeout if block else 0):
+                raise Empty
+
+            return self._heap.heappop()
+
+    def get_many(self, k, block=True, timeout=None):
+        """
+        Remove and return the `k` smallest keys (or every key if there are fewer).  If `block` is true, wait up to
+        `timeout` seconds (forever if None) for at least one.
+
+        Raises
+        ------
+        queue.Empty if there's no key to return.
+
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._heap.__len__, timeout if block else 0):
+                raise Empty
+
+            return self._heap.pop_many(k)
+
+    def reprioritize(self, entry, key):
+        """Change the key of `entry` to `key` and return the item's entry.  (See `heap_queue.reprioritize`.)
+        """
+        with self._not_empty:
+            return reprioritize(self._heap, entry, key)
+
+    def remove(self, entry):
+        """Remove `entry` from the queue.
+        """
+        with self._not_empty:
+            entry.delete()
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self._heap!r})'
+
+
+class AsyncHeapQueue:
+    """
+    An asyncio priority queue over a heap (a new `PairingHeap` by default).  `get` waits until the queue is
+    non-empty.
+
+    Notes
+    -----
+    Like `asyncio.Queue`, this isn't thread-safe; use it from the event loop's thread.  Entries returned by `put`
+    must only be changed through `reprioritize` and `remove`.
+
+    """
+    __slots__ = '_heap', '_getters',
+
+    def __init__(self, heap=None):
+        self._heap = PairingHeap() if heap is None else heap
+        self._getters = deque()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def _wakeup(self, n=1):
+        """Wake up to `n` waiting getters.
+        """
+        getters = self._getters
+        while n and getters:
+            getter = getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                n -= 1
+
+    def put(self, key):
+        """Put `key` in the queue and return its entry (if the heap returns entries).
+        """
+        entry = self._heap.heappush(key)
+        self._wakeup()
+        return entry
+
+    def put_many(self, keys):
+        """Put each of `keys` in the queue and return their entries (if the heap returns entries).
+        """
+        entries = self._heap.push_many(keys)
+        self._wakeup(len(self._heap))
+        return entries
+
+    async def _wait(self, timeout):
+        """
+        Wait up to `timeout` seconds (forever if None) for the queue to be non-empty.
+
+        Raises
+        ------
+        asyncio.TimeoutError if the timeout expires.
+
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while not self._heap:
+            getter = loop.create_future()
+            self._getters.append(getter)
+            try:
+                if deadline is None:
+                    await getter
+                else:
+                    await asyncio.wait_for(getter, deadline - loop.time())
+            except:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    pass
+
+                # If this getter was woken as it was cancelled, pass the wake-up on.
+                if self._heap and not getter.cancelled():
+                    self._wakeup()
+
+                raise
+
+    async def get(self, timeout=None):
+        """
+        Remove and return the smallest key, waiting up to `timeout` seconds (forever if None) for one.
+
+        Raises
+        ------
+        asyncio.TimeoutError if the timeout expires.
+
+        """
+        if not self._heap:
+            await self._wait(timeout)
+
+        return self._heap.heappop()
+
+    def get_nowait(self):
+        """
+        Remove and return the smallest key.
+
+        Raises
+        ------
+        asyncio.QueueEmpty if the queue is empty.
+
+        """
+        if not self._heap:
+            raise asyncio.QueueEmpty
+
+        return self._heap.heappop()
+
+    async def get_many(self, k, timeout=None):
+        """
+        Remove and return the `k` smallest keys (or every key if there are fewer), waiting up to `timeout` seconds
+        (forever if None) for at least one.
+
+        Raises
+        ------
+        asyncio.TimeoutError if the timeout expires.
+
+        """
+        if not self._heap:
+            await self._wait(timeout)
+
+        return self._heap.pop_many(k)
+
+    def reprioritize(self, entry, key):
+        """Change the key of `entry` to `key` and return the item's entry.  (See `heap_queue.reprioritize`.)
+        """
+        return reprioritize(self._heap, entry, key)
+
+    def remove(self, entry):
+        """Remove `entry` from the queue.
+        """
+        entry.delete()
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self._heap!r})'
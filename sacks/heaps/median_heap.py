@@ -1,7 +1,14 @@
+from collections import deque
+from heapq import _heapify_max as heapify_max
 from heapq import _heappop_max as heappop_max
 from heapq import _siftdown_max
+from heapq import heapify as heapify_min
 from heapq import heappop as heappop_min
 from heapq import heappush as heappush_min
+from itertools import count
+from operator import itemgetter
+
+from ..iterators.ring_buffer import RingBuffer
 
 
 def heappush_max(heap, item):
@@ -10,72 +17,369 @@ def heappush_max(heap, item):
     _siftdown_max(heap, 0, len(heap) - 1)
 
 
-class MedianHeap:
-    """Median heap implemented using two builtin lists."""
+class LazyHeap:
+    """
+    A builtin list heap (min or max depending on the given heapq functions) with lazy deletion.
+
+    Notes
+    -----
+    Deleted items are counted and popped once they reach the top of the heap, so `top` is always a live item.  The
+    heap is purged of deleted items once they outnumber its live items.
+
+    Deletions are counted by `ident(item)` (the item itself if `ident` is None), which must be hashable.  Nothing is
+    hashed until an item is deleted.
+    """
+
+    __slots__ = ("items", "deleted", "len", "_push", "_pop", "_heapify", "_ident")
+
+    def __init__(self, push, pop, heapify, ident=None):
+        self.items = []
+        self.deleted = {}
+        self.len = 0
+        self._push = push
+        self._pop = pop
+        self._heapify = heapify
+        self._ident = ident
+
+    @property
+    def top(self):
+        return self.items[0]
+
+    def __iter__(self):
+        if not self.deleted:
+            yield from self.items
+            return
+
+        deleted = dict(self.deleted)
+        ident = self._ident
+        for item in self.items:
+            key = item if ident is None else ident(item)
+            if count := deleted.get(key):
+                deleted[key] = count - 1
+            else:
+                yield item
+
+    def push(self, item):
+        self._push(self.items, item)
+        self.len += 1
+
+    def pop(self):
+        item = self._pop(self.items)
+        self.len -= 1
+        self._prune()
+        return item
+
+    def delete(self, item):
+        """Lazily delete `item`, which must be in the heap."""
+        key = item if self._ident is None else self._ident(item)
+        self.deleted[key] = self.deleted.get(key, 0) + 1
+        self.len -= 1
+
+        if len(self.items) > 2 * self.len:
+            self._purge()
+        else:
+            self._prune()
+
+    def _prune(self):
+        items, deleted, ident = self.items, self.deleted, self._ident
+        while items and deleted:
+            key = items[0] if ident is None else ident(items[0])
+            if not (count := deleted.get(key)):
+                return
+
+            self._pop(items)
+            if count == 1:
+                del deleted[key]
+            else:
+                deleted[key] = count - 1
+
+    def _purge(self):
+        self.items = list(self)
+        self.deleted.clear()
+        self._heapify(self.items)
+
+
+def min_heap(ident=None):
+    return LazyHeap(heappush_min, heappop_min, heapify_min, ident)
+
+
+def max_heap(ident=None):
+    return LazyHeap(heappush_max, heappop_max, heapify_max, ident)
+
+
+class QuantileHeap:
+    """
+    Tracks the `q`-quantile of its items with two heaps: a max-heap of the lowest `floor(q * (n - 1)) + 1` items,
+    whose top is the quantile, and a min-heap of the rest.
 
-    __slots__ = ("_maxheap", "_minheap")
+    Notes
+    -----
+    Pushing, popping the quantile and removing an item are O(log n) amortized; `quantile`, `min` and `max` are
+    O(1) amortized.  The minimum and maximum are the tops of two more heaps over all items.  These are built (in
+    O(n)) the first time `min` or `max` is asked for and maintained afterwards, doubling the cost of later
+    operations.
 
-    def __init__(self, iterable=()):
-        self._maxheap = []
-        self._minheap = []
+    Removed items are deleted lazily (see LazyHeap).  `remove` and `in` need hashable items: the first call counts
+    the occurrences of each item (in O(n)) and later pushes keep the counts.  Until then, items are never hashed.
+
+    If `key` is given, items are ordered by `key(item)`, computed once per push.  If `key` is given or `fifo` is
+    true, each item is stored as a `(key, order, item)` record, so items with equal keys are ordered by insertion
+    and are never compared themselves.  Records are deleted by their order, so even then only `remove` and `in` hash
+    items; `remove` removes the oldest occurrence of an item.  Otherwise, equal items are interchangeable and
+    deleted by value, so popping hashes items once `min` or `max` has been asked for.
+    """
+
+    __slots__ = ("_q", "_lower", "_upper", "_lows", "_highs", "_counts", "_key", "_order")
+
+    def __init__(self, q, iterable=(), key=None, fifo=False):
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+
+        self._q = q
+        self._key = key
+        self._order = count() if key is not None or fifo else None
+        self._lower = max_heap(self._ident)
+        self._upper = min_heap(self._ident)
+        self._lows = self._highs = None
+        # Number of occurrences of each item or, with records, a deque of its records (oldest first).  Built by the
+        # first `remove` or `in`.
+        self._counts = None
 
         for item in iterable:
             self.heappush(item)
 
     def __len__(self):
-        return len(self._maxheap) + len(self._minheap)
+        return self._lower.len + self._upper.len
 
     def __iter__(self):
-        yield from self._maxheap
-        yield from self._minheap
+        return map(self._unwrap, self._records())
+
+    def _records(self):
+        yield from self._lower
+        yield from self._upper
+
+    def _unwrap(self, record):
+        return record if self._order is None else record[2]
 
     @property
-    def median(self):
-        maxheap = self._maxheap
-        minheap = self._minheap
+    def _ident(self):
+        """What deletions are counted by: records by their order, plain items by value."""
+        return None if self._order is None else itemgetter(1)
+
+    def __contains__(self, item):
+        if self._counts is None:
+            self._track_counts()
+
+        return item in self._counts
+
+    def _track_counts(self):
+        self._counts = counts = {}
+
+        if self._order is None:
+            for item in self._records():
+                counts[item] = counts.get(item, 0) + 1
+        else:
+            for record in sorted(self._records(), key=itemgetter(1)):
+                counts.setdefault(record[2], deque()).append(record)
 
-        if len(maxheap) < len(minheap):
-            return minheap[0]
+    @property
+    def q(self):
+        return self._q
+
+    @property
+    def quantile(self):
+        if not self:
+            raise IndexError("empty heap")
 
-        return maxheap[0]
+        return self._unwrap(self._lower.top)
 
     @property
     def min(self):
-        maxheap = self._maxheap
-        n = len(maxheap)
-        return min(maxheap[i] for i in range(n >> 1, n))
+        if not self:
+            raise IndexError("empty heap")
+
+        if self._lows is None:
+            self._track_extremes()
+
+        return self._unwrap(self._lows.top)
 
     @property
     def max(self):
-        minheap = self._minheap
-        n = len(minheap)
-        return max(minheap[i] for i in range(n >> 1, n))
+        if not self:
+            raise IndexError("empty heap")
 
-    def heappop(self):
-        maxheap = self._maxheap
-        minheap = self._minheap
+        if self._highs is None:
+            self._track_extremes()
 
-        if len(maxheap) < len(minheap):
-            return heappop_min(minheap)
+        return self._unwrap(self._highs.top)
 
-        return heappop_max(maxheap)
+    def _track_extremes(self):
+        self._lows = min_heap(self._ident)
+        self._highs = max_heap(self._ident)
 
-    def heappush(self, item):
-        maxheap = self._maxheap
-        minheap = self._minheap
+        for extremes in (self._lows, self._highs):
+            extremes.items = list(self._records())
+            extremes.len = len(self)
+            extremes._heapify(extremes.items)
 
+    def heappop(self):
+        """Pop the quantile."""
         if not self:
-            return minheap.append(item)
+            raise IndexError("pop from empty heap")
+
+        record = self._lower.pop()
+        self._forget(record)
+        self._balance()
+        return self._unwrap(record)
 
-        if item > self.median:
-            heappush_min(minheap, item)
+    def heappush(self, item):
+        self._push(item)
+
+    def _push(self, item):
+        """Push `item` and return its record."""
+        if self._order is None:
+            record = item
+        else:
+            record = item if self._key is None else self._key(item), next(self._order), item
+
+        if (counts := self._counts) is not None:
+            if self._order is None:
+                counts[item] = counts.get(item, 0) + 1
+            else:
+                counts.setdefault(item, deque()).append(record)
+
+        if self._lows is not None:
+            self._lows.push(record)
+            self._highs.push(record)
+
+        lower = self._lower
+        if lower.len and not lower.top < record:
+            lower.push(record)
+        else:
+            self._upper.push(record)
+
+        self._balance()
+        return record
+
+    def remove(self, item):
+        """
+        Remove one occurrence of `item`.
+
+        Raises
+        ------
+        KeyError if `item` isn't in the heap.
+
+        """
+        if item not in self:
+            raise KeyError(item)
+
+        self._discard(item if self._order is None else self._counts[item][0])
+
+    def _discard(self, record):
+        """Remove `record`, which must be in the heap."""
+        self._forget(record)
+
+        lower = self._lower
+        if lower.len and not lower.top < record:
+            # Records no greater than the top of the lower heap can only be in the lower heap.
+            lower.delete(record)
         else:
-            heappush_max(maxheap, item)
+            self._upper.delete(record)
+
+        self._balance()
+
+    def _forget(self, record):
+        counts = self._counts
+        if counts is not None and self._order is None:
+            count = counts[record]
+            if count == 1:
+                del counts[record]
+            else:
+                counts[record] = count - 1
+        elif counts is not None:
+            records = counts[record[2]]
+            records.remove(record)
+            if not records:
+                del counts[record[2]]
+
+        if self._lows is not None:
+            self._lows.delete(record)
+            self._highs.delete(record)
+
+    def _balance(self):
+        n = len(self)
+        target = int(self._q * (n - 1)) + 1 if n else 0
+
+        lower, upper = self._lower, self._upper
+        while lower.len > target:
+            upper.push(lower.pop())
+        while lower.len < target:
+            lower.push(upper.pop())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._q!r}, {list(self)!r})"
+
+
+class MedianHeap(QuantileHeap):
+    """Median heap implemented using two builtin lists.  (The median of an even number of items is the lower one.)"""
+
+    __slots__ = ()
+
+    def __init__(self, iterable=(), key=None, fifo=False):
+        super().__init__(0.5, iterable, key, fifo)
+
+    @property
+    def median(self):
+        return self.quantile
+
+    def __repr__(self):
+        lower = list(map(self._unwrap, self._lower))
+        upper = list(map(self._unwrap, self._upper))
+        return f"{type(self).__name__}({lower!r}, {upper!r})"
+
+
+class SlidingMedian:
+    """
+    Median of the last `window` items pushed.
+
+    Notes
+    -----
+    Items that fall out of the window are removed from a MedianHeap, so each push is O(log window) amortized.
+
+    If `key` is given, items are ordered by `key(item)` and needn't be hashable; otherwise they must be.
+    """
+
+    __slots__ = ("_window", "_heap")
+
+    def __init__(self, window, iterable=(), key=None):
+        self._window = RingBuffer(window)
+        self._heap = MedianHeap(key=key)
+
+        for item in iterable:
+            self.push(item)
+
+    def __len__(self):
+        return len(self._window)
+
+    @property
+    def window(self):
+        return self._window.size
+
+    @property
+    def median(self):
+        if not self._window:
+            raise IndexError("no items in window")
+
+        return self._heap.median
+
+    def push(self, item):
+        """Push `item`, expiring the oldest item if the window is full."""
+        # The window holds the heap's records, so expired items are removed without being looked up.
+        window = self._window
+        if len(window) == window.size:
+            self._heap._discard(window.popleft())
 
-        if len(maxheap) - len(minheap) > 1:
-            heappush_min(minheap, heappop_max(maxheap))
-        elif len(minheap) - len(maxheap) > 1:
-            heappush_max(maxheap, heappop_min(minheap))
+        window.append(self._heap._push(item))
 
     def __repr__(self):
-        return f"{type(self).__name__}({self._maxheap!r}, {self._minheap!r})"
+        return f"{type(self).__name__}(window={self.window}, median={self._heap.median if self else None!r})"
@@ -1,7 +1,7 @@
 from random import random
 
-from .heap import Heap
-from ..primitives.node import BinaryNode
+from .heap import Heap, best_first, meld_pairwise
+from ..primitives.meldable_heap_node import FifoMeldableHeapNode, MeldableHeapNode
 
 def meld(a, b):
     """Merge two trees into a single tree. Rough balancing achieved with a coin-flip.
@@ -15,12 +15,30 @@ def meld(a, b):
     if a > b:
         a, b = b, a
 
-    if round(random()):
-        a.left = meld(a.left, b)
-    else:
-        a.right = meld(a.right, b)
+    root = a
+    while True:  # Meld `b` into a random child of `a`, where `a <= b`.
+        if random() < .5:
+            child = a.left
+            if child is None:
+                a.left = b
+                return root
 
-    return a
+            if child > b:
+                a.left = b
+                a, b = b, child
+            else:
+                a = child
+        else:
+            child = a.right
+            if child is None:
+                a.right = b
+                return root
+
+            if child > b:
+                a.right = b
+                a, b = b, child
+            else:
+                a = child
 
 
 class MeldableHeap(Heap):
@@ -32,20 +50,60 @@ class MeldableHeap(Heap):
     [https://en.wikipedia.org/wiki/Randomized_meldable_heap]
 
     """
-    def heappush(self, key):
-        self._root = meld(self._root, BinaryNode(key))
+    _node_type = MeldableHeapNode
+    _fifo_node_type = FifoMeldableHeapNode
+
+    def heappush(self, item):
+        self._root = meld(self._root, self._new_node(item))
         self._size += 1
 
+    def _merge(self, other):
+        self._root = meld(self._root, other._root)
+        self._size += other._size
+
+    def heapify(self, iterable):
+        trees = [ self._new_node(item) for item in iterable ]
+        self._size += len(trees)
+
+        if self._root is not None:
+            trees.append(self._root)
+
+        self._root = meld_pairwise(trees, meld)
+
+    def push_many(self, iterable):
+        self.heapify(iterable)
+
+    def pop_many(self, k):
+        """
+        Pop the `k` smallest keys (or every key if there are fewer) and return them in order.
+
+        Notes
+        -----
+        The smallest nodes are found by a best-first search and the subtrees left behind are melded pairwise once.
+
+        """
+        least, frontier = best_first(self._tops(), self._children, k)
+        self._size -= len(least)
+        self._root = meld_pairwise(frontier, meld)
+        return [ self._item(node) for node in least ]
+
     def heappop(self):
         if not self:
             raise IndexError('pop from empty heap')
 
         self._size -= 1
 
-        try:
-            return self._root.key
-        finally:
-            self._root = meld(self._root.left, self._root.right)
+        root = self._root
+        self._root = meld(root.left, root.right)
+        return self._item(root)
+
+    def replace(self, item):
+        if not self:
+            raise IndexError('replace on empty heap')
+
+        root = self._root
+        self._root = meld(self._new_node(item), meld(root.left, root.right))
+        return self._item(root)
 
     def __repr__(self):
         return f'{type(self).__name__}[size={self._size}]'
@@ -1,5 +1,5 @@
-from .heap import Heap
-from ..primitives.node import SlotNode
+from .heap import Heap, Entry, meld_pairwise
+from ..primitives.pairing_heap_node import FifoPairingHeapNode, PairingHeapNode
 
 def meld(a, b):
     """Merge two heaps, destructively.
@@ -13,23 +13,49 @@ def meld(a, b):
     if a > b:
         a, b = b, a
 
-    a.children.append(b)
+    a.add_child(b)
     return a
 
-def pair(children):
-    """Recursively meld a list of heaps.
+def pair(first):
     """
-    if not children:
+    Meld a linked list of heaps starting at `first` with the two-pass method: meld adjacent pairs left to right,
+    then meld the results right to left.
+
+    Notes
+    -----
+    The results of the first pass are stacked through their (unused) `next` links, so no memory is allocated.
+
+    """
+    stack = None
+    while first is not None:
+        second = first.next
+        first.next = first.prev = None
+
+        if second is None:
+            tree = first
+            first = None
+        else:
+            rest = second.next
+            second.next = second.prev = None
+            tree = meld(first, second)
+            first = rest
+
+        tree.next = stack
+        stack = tree
+
+    if stack is None:
         return None
 
-    if len(children) == 1:
-        return children[0]
+    root, stack = stack, stack.next
+    root.next = None
+    while stack is not None:
+        tree, stack = stack, stack.next
+        tree.next = None
+        root = meld(tree, root)
 
-    first, second, *rest = children
-    return meld(meld(first, second), pair(rest))
+    return root
 
 
-# Note if decrease_key is added to PairingHeap, SlotNode.children should be changed to a linked-list for efficient deletion operations.
 class PairingHeap(Heap):
     """
     A simple heap-ordered tree with excellent practical performance.
@@ -39,9 +65,32 @@ class PairingHeap(Heap):
     [https://en.wikipedia.org/wiki/Pairing_heap]
 
     """
-    def heappush(self, key):
-        self._root = meld(self._root, SlotNode(key))
+    _node_type = PairingHeapNode
+    _fifo_node_type = FifoPairingHeapNode
+
+    def heappush(self, item):
+        node = self._new_node(item)
+        self._root = meld(self._root, node)
         self._size += 1
+        return Entry(node, self)
+
+    def _merge(self, other):
+        self._root = meld(self._root, other._root)
+        self._size += other._size
+
+    def heapify(self, iterable):
+        self._add_trees([ self._new_node(item) for item in iterable ])
+
+    def push_many(self, iterable):
+        """Push all items of `iterable`, melding them into a single tree first.  Return a list of their entries.
+        """
+        nodes = [ self._new_node(item) for item in iterable ]
+        self._add_trees(nodes)
+        return [ Entry(node, self) for node in nodes ]
+
+    def _add_trees(self, trees):
+        self._size += len(trees)
+        self._root = meld(self._root, meld_pairwise(trees, meld))
 
     def heappop(self):
         if not self:
@@ -49,10 +98,26 @@ class PairingHeap(Heap):
 
         self._size -= 1
 
-        try:
-            return self._root.key
-        finally:
-            self._root = pair(self._root.children)
+        root = self._root
+        self._root = pair(root.child)
+        root.pop()
+        return self._item(root)
+
+    def replace(self, item):
+        if not self:
+            raise IndexError('replace on empty heap')
+
+        root = self._root
+        self._root = meld(pair(root.child), self._new_node(item))
+        root.pop()
+        return self._item(root)
+
+    def decrease_key(self, node, key):
+        node.key = key
+
+        if node is not self._root:
+            node.cut()
+            self._root = meld(self._root, node)
 
     def __repr__(self):
         return f'{type(self).__name__}[size={self._size}]'
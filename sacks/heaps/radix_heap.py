@@ -0,0 +1,220 @@
+from .heap import Heap
+
+
+class RadixHeap(Heap):
+    """
+    A monotone heap of non-negative integers.  Keys are kept in buckets by the highest bit in which they differ from
+    the last popped key, so there are no per-key nodes, only lists.
+
+    Keys pushed must be no less than the last popped key (as they are in Dijkstra's algorithm or an event
+    scheduler).
+
+    Notes
+    -----
+    Pushing is O(1).  Popping from an empty bucket 0 moves the keys of the next non-empty bucket into lower buckets;
+    a key can only move down O(log C) times, where C is the greatest difference between a pushed key and the last
+    popped key, so popping is O(log C) amortized.
+
+    `decrease_key` is lazy: it pushes the new key and counts the old one as stale, and stale keys are dropped as
+    they're popped, so it's O(1) amortized.  To check that decreased keys are in the heap, the first `decrease_key`
+    counts the occurrences of each key (in O(n)) and later pushes and pops keep the counts.
+
+    The least key is cached: `min` is O(1) while bucket 0 holds it and otherwise scans one bucket, at most once
+    between pops.
+
+    References
+    ----------
+    [https://en.wikipedia.org/wiki/Radix_heap]
+
+    """
+    __slots__ = '_buckets', '_last', '_min', '_counts', '_stale',
+
+    def __init__(self, iterable=()):
+        self._buckets = [ [ ] ]
+        self._last = 0
+        self._min = None
+        # Number of live occurrences of each key (built by the first `decrease_key`) and of stale occurrences.
+        self._counts = None
+        self._stale = { }
+
+        super().__init__(iterable)
+
+    @property
+    def last(self):
+        """The last popped key (0 if no key has been popped).  Keys pushed must be no less than this.
+        """
+        return self._last
+
+    @property
+    def min(self):
+        if not self._size:
+            raise IndexError('empty heap')
+
+        if self._min is None:
+            # Every key of a bucket is less than every key of the buckets above it.
+            self._min = min(next(live for bucket in self._buckets if (live := self._live(bucket))))
+
+        return self._min
+
+    def _live(self, keys):
+        """Return `keys` without their stale occurrences.
+        """
+        stale = self._stale
+        if not stale:
+            return keys
+
+        skipped = { }
+        live = [ ]
+        for key in keys:
+            if key in stale and skipped.get(key, 0) < stale[key]:
+                skipped[key] = skipped.get(key, 0) + 1
+            else:
+                live.append(key)
+
+        return live
+
+    def _check(self, key):
+        if key < self._last:
+            raise ValueError(f'{key!r} less than last popped key {self._last!r}')
+
+    def _bucket(self, key):
+        """Return the bucket `key` belongs in, adding buckets if needed.
+        """
+        buckets = self._buckets
+        i = (key ^ self._last).bit_length()
+        while i >= len(buckets):
+            buckets.append([ ])
+
+        return buckets[i]
+
+    def heappush(self, key):
+        self._check(key)
+        self._bucket(key).append(key)
+        self._size += 1
+
+        if self._counts is not None:
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+        if self._min is not None and key < self._min:
+            self._min = key
+
+    def push_many(self, iterable):
+        self.heapify(iterable)
+
+    def pushpop(self, key):
+        self._check(key)
+        if not self._size or not self.min < key:
+            return key
+
+        return super().replace(key)
+
+    def replace(self, key):
+        if self._size and key < self.min:
+            raise ValueError(f'{key!r} less than popped key {self.min!r}')
+
+        return super().replace(key)
+
+    def nsmallest(self, k):
+        # Every key of a bucket is less than every key of the buckets above it.
+        least = [ ]
+        for bucket in self._buckets:
+            if len(least) >= k:
+                break
+
+            least.extend(sorted(self._live(bucket))[:k - len(least)])
+
+        return least
+
+    def heappop(self):
+        if not self._size:
+            raise IndexError('pop from empty heap')
+
+        buckets, stale = self._buckets, self._stale
+        while True:
+            if not buckets[0]:
+                bucket = next(bucket for bucket in buckets if bucket)
+                last = self._last = min(bucket)
+
+                # Every key of `bucket` now differs from `last` in a lower bit than before.
+                for key in bucket:
+                    buckets[(key ^ last).bit_length()].append(key)
+                bucket.clear()
+
+            key = buckets[0].pop()
+            if not stale or not (count := stale.get(key)):
+                break
+
+            if count == 1:
+                del stale[key]
+            else:
+                stale[key] = count - 1
+
+        self._size -= 1
+        self._min = None
+
+        if (counts := self._counts) is not None:
+            if counts[key] == 1:
+                del counts[key]
+            else:
+                counts[key] -= 1
+
+        if not self._size and stale:
+            self._buckets = [ [ ] ]
+            stale.clear()
+
+        return key
+
+    def decrease_key(self, key, new_key):
+        """
+        Replace one occurrence of `key` with the lesser `new_key`.
+
+        Raises
+        ------
+        KeyError if `key` isn't in the heap.
+
+        ValueError if `new_key` is greater than `key` or less than the last popped key.
+
+        """
+        if key < new_key:
+            raise ValueError(f'{new_key!r} greater than {key!r}')
+
+        self._check(new_key)
+
+        if self._counts is None:
+            self._counts = counts = { }
+            for bucket in self._buckets:
+                for k in bucket:
+                    counts[k] = counts.get(k, 0) + 1
+
+        count = self._counts.get(key)
+        if not count:
+            raise KeyError(key)
+
+        if new_key == key:
+            return
+
+        if count == 1:
+            del self._counts[key]
+        else:
+            self._counts[key] = count - 1
+        self._stale[key] = self._stale.get(key, 0) + 1
+        self._size -= 1
+
+        self.heappush(new_key)
+
+    def _merge(self, other):
+        if other and other.min < self._last:
+            raise ValueError(f'{other.min!r} less than last popped key {self._last!r}')
+
+        self.heapify(key for bucket in other._buckets for key in other._live(bucket))
+
+        other._buckets = [ [ ] ]
+        other._last = 0
+        other._min = other._counts = None
+        other._stale = { }
+
+    def __repr__(self):
+        return f'{type(self).__name__}[size={self._size}, last={self._last}]'
+
+    def __str__(self):
+        return str([ self._live(bucket) for bucket in self._buckets ])
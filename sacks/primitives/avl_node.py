@@ -3,14 +3,20 @@ from .sentinel import sentinel
 
 
 class AVLNode(BSTNode):
-    """Primitive of a AVL tree.
+    """Primitive of a AVL tree.  Each node also tracks the `size` of its subtree.
     """
-    __slots__ = '_left', '_right', 'balance',
+    __slots__ = '_left', '_right', 'balance', 'size',
 
     def __init__(self, key):
         self.key = key
         self.parent = self.left = self.right = EMPTY
         self.balance = 0
+        self.size = 1
+
+    def update(self):
+        """Recompute data aggregated from this node's children.
+        """
+        self.size = self.left.size + self.right.size + 1
 
     @property
     def is_left_child(self):
@@ -34,34 +40,72 @@ class AVLNode(BSTNode):
         self._right = node
         node.parent = self
 
-    def add_key(self, key):
-        if key < self.key:
-            self.left, new_node = self.left.add_key(key)
-        else:
-            self.right, new_node = self.right.add_key(key)
+    def update_ancestors(self):
+        """Update aggregated data of this node's ancestors.
+        """
+        node = self.parent
+        while node:
+            node.update()
+            node = node.parent
 
+    def add_key(self, key):
+        """Add a node with `key` to this subtree.  Return the root of this subtree and the new node.
+        """
+        node = self
+        while True:
+            if key < node.key:
+                if not node.left:
+                    node.left = new_node = type(self)(key)
+                    break
+                node = node.left
+            else:
+                if not node.right:
+                    node.right = new_node = type(self)(key)
+                    break
+                node = node.right
+
+        new_node.update_ancestors()
         return self, new_node
 
     def remove_key(self, key):
-        if key < self.key:
-            self.left, unbalanced_node = self.left.remove_key(key)
-        elif key > self.key:
-            self.right, unbalanced_node = self.right.remove_key(key)
+        """
+        Remove a node with `key` from this subtree.  Return the new root of this subtree, the parent of the
+        removed node and whether the removed node was a left child.
+        """
+        node = self
+        while node:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                break
         else:
-            if not self.left or not self.right:
-                self.parent.balance -= 1 if self.is_left_child else -1
-                return self.right or self.left, self.parent
+            raise KeyError(key)
 
+        if node.left and node.right:
             # Replace node with its successor.
-            successor = self.right
+            successor = node.right
             while successor.left:
                 successor = successor.left
 
-            self.key = successor.key
-            self.right, unbalanced_node = self.right.remove_key(successor.key)
+            node.key = successor.key
+            node = successor
 
-        return self, unbalanced_node
+        child = node.left or node.right
+        parent, is_left = node.parent, node.is_left_child
+
+        if node is self:
+            child.parent = EMPTY
+            return child, EMPTY, False
+
+        if is_left:
+            parent.left = child
+        else:
+            parent.right = child
 
+        node.update_ancestors()
+        return self, parent, is_left
 
 EMPTY = sentinel(
     name='AVLEmptyNode',
@@ -78,5 +122,6 @@ EMPTY = sentinel(
     },
     attrs={
         'balance': 0,
+        'size': 0,
     },
 )
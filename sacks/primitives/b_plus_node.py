@@ -0,0 +1,99 @@
+class BPlusLeaf:
+    """Primitive of a B+ tree.  A sorted list of keys linked to its neighboring leaves.
+    """
+    __slots__ = 'keys', 'prev', 'next',
+
+    def __init__(self, keys=None, prev=None, next=None):
+        self.keys = keys if keys is not None else [ ]
+        self.prev = prev
+        self.next = next
+
+    def split(self):
+        """Move the upper half of this leaf's keys into a new right neighbor.  Return the separator and the new leaf.
+        """
+        keys = self.keys
+        mid = len(keys) >> 1
+
+        sibling = BPlusLeaf(keys[mid:], self, self.next)
+        del keys[mid:]
+
+        if self.next is not None:
+            self.next.prev = sibling
+        self.next = sibling
+
+        return sibling.keys[0], sibling
+
+    def merge(self, right, sep):
+        """Absorb the right neighbor `right` into this leaf.
+        """
+        self.keys.extend(right.keys)
+
+        self.next = right.next
+        if right.next is not None:
+            right.next.prev = self
+
+        right.prev = right.next = None
+
+    def borrow_left(self, left, sep):
+        """Move the last key of `left` into this leaf.  Return the new separator.
+        """
+        self.keys.insert(0, left.keys.pop())
+        return self.keys[0]
+
+    def borrow_right(self, right, sep):
+        """Move the first key of `right` into this leaf.  Return the new separator.
+        """
+        self.keys.append(right.keys.pop(0))
+        return right.keys[0]
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.keys!r})'
+
+
+class BPlusInternal:
+    """
+    Primitive of a B+ tree.  `keys[i]` separates `children[i]` and `children[i + 1]`: every key in `children[i]`
+    is less than `keys[i]` and every key in `children[i + 1]` is greater than or equal to it.
+    """
+    __slots__ = 'keys', 'children',
+
+    def __init__(self, keys, children):
+        self.keys = keys
+        self.children = children
+
+    def split(self):
+        """Move the upper half of this node's children into a new node.  Return the separator and the new node.
+        """
+        keys, children = self.keys, self.children
+        mid = len(keys) >> 1
+
+        sep = keys[mid]
+        sibling = BPlusInternal(keys[mid + 1:], children[mid + 1:])
+        del keys[mid:]
+        del children[mid + 1:]
+
+        return sep, sibling
+
+    def merge(self, right, sep):
+        """Absorb the right sibling `right`, separated from this node by `sep`, into this node.
+        """
+        self.keys.append(sep)
+        self.keys.extend(right.keys)
+        self.children.extend(right.children)
+
+    def borrow_left(self, left, sep):
+        """Move the last child of `left` into this node.  Return the new separator.
+        """
+        self.keys.insert(0, sep)
+        self.children.insert(0, left.children.pop())
+        return left.keys.pop()
+
+    def borrow_right(self, right, sep):
+        """Move the first child of `right` into this node.  Return the new separator.
+        """
+        self.keys.append(sep)
+        self.children.append(right.children.pop(0))
+        return right.keys.pop(0)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.keys!r})'
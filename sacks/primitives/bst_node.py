@@ -12,51 +12,85 @@ class BSTNode(BinaryNode):
         self.left = self.right = EMPTY
 
     def __contains__(self, key):
-        if key < self.key:
-            return key in self.left
+        node = self
+        while node:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                return True
 
-        if key > self.key:
-            return key in self.right
-
-        return True
+        return False
 
     def __iter__(self):
-        yield from self.left
-        yield self.key
-        yield from self.right
+        stack = [ ]
+        node = self
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+
+            node = stack.pop()
+            yield node.key
+            node = node.right
 
     def __reversed__(self):
-        yield from reversed(self.right)
-        yield self.key
-        yield from reversed(self.left)
+        stack = [ ]
+        node = self
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.right
 
-    def add_key(self, key):
-        if key < self.key:
-            self.left = self.left.add_key(key)
-        else:
-            self.right = self.right.add_key(key)
+            node = stack.pop()
+            yield node.key
+            node = node.left
 
-        return self
+    def add_key(self, key):
+        node = self
+        while True:
+            if key < node.key:
+                if not node.left:
+                    node.left = type(self)(key)
+                    return self
+                node = node.left
+            else:
+                if not node.right:
+                    node.right = type(self)(key)
+                    return self
+                node = node.right
 
     def remove_key(self, key):
-        if key < self.key:
-            self.left = self.left.remove_key(key)
-        elif key > self.key:
-            self.right = self.right.remove_key(key)
+        parent, node = None, self
+        while node:
+            if key < node.key:
+                parent, node = node, node.left
+            elif key > node.key:
+                parent, node = node, node.right
+            else:
+                break
         else:
-            if not self.left:
-                return self.right
-
-            if not self.right:
-                return self.left
+            raise KeyError(key)
 
+        if node.left and node.right:
             # Replace node with its successor.
-            successor = self.right
+            parent, successor = node, node.right
             while successor.left:
-                successor = successor.left
+                parent, successor = successor, successor.left
+
+            node.key = successor.key
+            node = successor
+
+        child = node.left or node.right
 
-            self.key = successor.key
-            self.right = self.right.remove_key(successor.key)
+        if parent is None:
+            return child
+
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
 
         return self
 
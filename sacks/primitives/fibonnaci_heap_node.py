@@ -1,15 +1,23 @@
 from .block import Block
-from .node import Node
+from .node import Node, fifo_lt
 
 
 class FibHeapNode(Block, Node):
-    """Primitive of a Fibonacci Heap.  A combination of a tree node and a doubly-linked block.
     """
-    __slots__ = 'key', 'parent', 'children', 'degree', 'marked',
+    Primitive of a Fibonacci Heap.  A combination of a tree node and a doubly-linked block.
+
+    `item` and `order` are only set by heaps with a key function or FIFO tie-breaking.
+    """
+    __slots__ = 'key', 'parent', 'children', 'degree', 'marked', 'item', 'order',
 
     def __init__(self, key):
-        super().__init__()
+        self.reset(key)
+
+    def reset(self, key):
+        """(Re-)initialize this node as a lone root with `key`.
+        """
         self.key = key
+        self.prev = self.next = self
         self.parent = None
         self.children = None
         self.degree = 0
@@ -19,6 +27,18 @@ class FibHeapNode(Block, Node):
     def is_root(self):
         return self.parent is None
 
+    @property
+    def is_deleted(self):
+        return self.next is None
+
+    def pop(self):
+        """Remove this node from its list, de-reference its links, and return its `key`.
+        """
+        self.remove()
+        self.next = self.prev = None
+        self.children = None
+        return self.key
+
     def add_child(self, child):
         child.remove()
         child.parent = self
@@ -35,3 +55,11 @@ class FibHeapNode(Block, Node):
         yield (current := self)
         while (current := current.next) is not self:
             yield current
+
+
+class FifoFibHeapNode(FibHeapNode):
+    """A Fibonacci heap node that breaks ties between equal keys by insertion order.
+    """
+    __slots__ = ()
+
+    __lt__ = fifo_lt
@@ -0,0 +1,24 @@
+from .avl_node import AVLNode
+
+
+class IntervalNode(AVLNode):
+    """Primitive of an interval tree.  `key` is a `(start, end)` pair and `max_end` is the greatest end in the subtree.
+    """
+    __slots__ = 'max_end',
+
+    def __init__(self, key):
+        super().__init__(key)
+        self.max_end = key[1]
+
+    def update(self):
+        """Recompute data aggregated from this node's children.
+        """
+        super().update()
+
+        max_end = self.key[1]
+        if self.left and self.left.max_end > max_end:
+            max_end = self.left.max_end
+        if self.right and self.right.max_end > max_end:
+            max_end = self.right.max_end
+
+        self.max_end = max_end
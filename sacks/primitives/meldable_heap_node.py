@@ -0,0 +1,18 @@
+from .node import BinaryNode, fifo_lt
+
+
+class MeldableHeapNode(BinaryNode):
+    """
+    Primitive of a meldable heap.
+
+    `item` and `order` are only set by heaps with a key function or FIFO tie-breaking.
+    """
+    __slots__ = 'item', 'order',
+
+
+class FifoMeldableHeapNode(MeldableHeapNode):
+    """A meldable heap node that breaks ties between equal keys by insertion order.
+    """
+    __slots__ = ()
+
+    __lt__ = fifo_lt
@@ -1,6 +1,18 @@
 from ._tree_printer import tree_printer
 
 
+def fifo_lt(self, other):
+    """Order nodes by key, then by insertion `order`.  (A `__lt__` for nodes of FIFO heaps.)
+    """
+    if self.key < other.key:
+        return True
+
+    if other.key < self.key:
+        return False
+
+    return self.order < other.order
+
+
 class BaseNode:
     """Base for a primitive element of a tree.
     """
@@ -0,0 +1,73 @@
+from ._tree_printer import tree_printer
+from .node import BaseNode, fifo_lt
+
+
+class PairingHeapNode(BaseNode):
+    """
+    Primitive of a pairing heap.  Children are kept in a doubly-linked list: `child` is the leftmost child, `next`
+    the right sibling, and `prev` the left sibling (or the parent for a leftmost child).
+
+    `item` and `order` are only set by heaps with a key function or FIFO tie-breaking.
+    """
+    __slots__ = 'key', 'child', 'next', 'prev', '_deleted', 'item', 'order',
+
+    def __init__(self, key):
+        self.key = key
+        self.child = self.next = self.prev = None
+        self._deleted = False
+
+    @property
+    def is_deleted(self):
+        return self._deleted
+
+    @property
+    def children(self):
+        children = [ ]
+        child = self.child
+        while child is not None:
+            children.append(child)
+            child = child.next
+
+        return children
+
+    def add_child(self, node):
+        """Make `node` (a root) the leftmost child of this node.
+        """
+        node.prev = self
+        node.next = self.child
+
+        if self.child is not None:
+            self.child.prev = node
+
+        self.child = node
+
+    def cut(self):
+        """Remove this node and its subtree from its parent.
+        """
+        if self.prev.child is self:
+            self.prev.child = self.next
+        else:
+            self.prev.next = self.next
+
+        if self.next is not None:
+            self.next.prev = self.prev
+
+        self.next = self.prev = None
+
+    def pop(self):
+        """De-reference this root's links, mark it deleted, and return its `key`.
+        """
+        self.child = self.next = self.prev = None
+        self._deleted = True
+        return self.key
+
+    def __str__(self):
+        return '\n'.join(tree_printer(self.key, self.children))
+
+
+class FifoPairingHeapNode(PairingHeapNode):
+    """A pairing heap node that breaks ties between equal keys by insertion order.
+    """
+    __slots__ = ()
+
+    __lt__ = fifo_lt
@@ -5,24 +5,6 @@ from ..sets import AVLTree
 NOT_KEY = sentinel(name='NotKey', repr='NOT_KEY')
 
 
-def successor(key, bst):
-    """Return the least key greater or equal to `key[:1]` in the binary search tree `bst` or None.
-    """
-    key = key[:1]
-    least_greatest, current = None, bst.root
-
-    while current:
-        if key == current.key.key:
-            return current.key
-
-        if key < current.key.key:
-            least_greatest, current = current.key, current.left
-        else:
-            current = current.right
-
-    return least_greatest
-
-
 class RadixNode(Node):
     """Primitive of an Adaptive Radix Tree.
     """
@@ -88,7 +70,7 @@ class RadixNode(Node):
 
             raise KeyError(key)
 
-        if (succ := successor(key, self.children)) and (n := len(succ)) == succ.matchlen(key):
+        if (succ := self.children.ceiling(key, None)) and (n := len(succ)) == succ.matchlen(key):
             return succ.find( key[n:] )
 
         raise KeyError(key)
@@ -108,7 +90,7 @@ class RadixNode(Node):
             finally:
                 self.value = value
 
-        if not (succ := successor(key, self.children)) or (n := succ.matchlen(key)) == 0:
+        if not (succ := self.children.ceiling(key, None)) or (n := succ.matchlen(key)) == 0:
             self.children.add( RadixNode(key, value, self) )
             return True
 
@@ -148,7 +130,7 @@ class RadixNode(Node):
                 self.parent.join()
             return
 
-        if (succ := successor(key, self.children)) and (n := len(succ)) == succ.matchlen(key):
+        if (succ := self.children.ceiling(key, None)) and (n := len(succ)) == succ.matchlen(key):
             return succ.delete( key[n:] )
 
         raise KeyError(key)
@@ -169,7 +151,12 @@ class RadixNode(Node):
             child.parent = self
 
     def __lt__(self, other):
-        return self.key[:1] < other.key[:1]
+        """Compare first characters of keys.  `other` may be a node or a key.
+        """
+        if isinstance(other, RadixNode):
+            other = other.key
+
+        return self.key[:1] < other[:1]
 
     def __repr__(self):
         return f'{type(self).__name__}(key={self.key!r}, value={self.value!r})'
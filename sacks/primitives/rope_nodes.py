@@ -7,36 +7,72 @@ from ._tree_printer import tree_printer
 # and internal nodes separated and we use attributes that are specific to ropes.
 
 class RopeNode(ABC):
-    """The base primitive of a Rope.
     """
-    __slots__ = '_strand', '_weight',
+    The base primitive of a Rope.
+
+    Notes
+    -----
+    Each node stores its parent and which side of the parent it hangs from, along with the total length of
+    its sequences (and internal nodes their height), so that nodes can be cut from and attached to a tree in O(1)
+    (plus an O(depth) length and height update).
+
+    """
+    __slots__ = '_parent', '_is_left', '_length',
 
     def __init__(self):
-        self._strand = DANGLING
-        self._weight = 0
+        self._parent = EMPTY
+        self._is_left = False
+        self._length = 0
 
     @property
     def parent(self):
-        return self._strand.parent
+        return self._parent
 
     @property
-    def strand(self):
-        return self._strand
+    def is_left_child(self):
+        return self._is_left
 
-    @strand.setter
-    def strand(self, strand):
-        self._strand.cut()
-        self._strand = strand
-        strand.dispatch_weight(sum(map(len, self)))
+    @property
+    def length(self):
+        """Total length of the sequences in this subtree.
+        """
+        return self._length
 
     @property
     def weight(self):
-        return self._weight
+        return self._length
+
+    def _dispatch_length(self, delta):
+        """Add `delta` to the length of this node and each of its ancestors.
+        """
+        node = self
+        while node is not EMPTY:
+            node._length += delta
+            node = node._parent
 
-    @weight.setter
-    def weight(self, value):
-        self._strand.dispatch_weight(value - self._weight)
-        self._weight = value
+    def detach(self):
+        """Remove this node from its parent.
+        """
+        parent = self._parent
+        if parent is EMPTY:
+            return
+
+        if self._is_left:
+            parent._left = EMPTY
+        else:
+            parent._right = EMPTY
+
+        parent._dispatch_length(-self._length)
+        parent._update_height()
+        self._parent = EMPTY
+
+    def replace(self, node):
+        """Put `node` in this node's place in its parent.
+        """
+        if self._is_left:
+            self._parent.left = node
+        else:
+            self._parent.right = node
 
     @abstractmethod
     def __iter__(self):
@@ -71,84 +107,27 @@ class RopeNode(ABC):
         pass
 
 
-class Strand(ABC):
-    """A channel between a node and its parent.
-    """
-    __slots__ = 'parent',
-
-    def __init__(self, parent):
-        self.parent = parent
-
-    @abstractmethod
-    def cut(self):
-        """Remove parent's reference to a child.
-        """
-        pass
-
-    @abstractmethod
-    def dispatch_weight(self, delta):
-        pass
-
-    @abstractmethod
-    def attach(self, child):
-        """Replace owner of this strand with `child` as `self.parent`'s child.
-        """
-        pass
-
-
-class LeftStrand(Strand):
-    def cut(self):
-        self.dispatch_weight(-sum(map(len, self.parent.left)))
-        self.parent._left._strand = DANGLING
-        self.parent._left = EMPTY
-
-    def dispatch_weight(self, delta):
-        self.parent.weight += delta
-
-    def attach(self, child):
-        self.parent.left = child
-
-
-class RightStrand(Strand):
-    def cut(self):
-        self.dispatch_weight(-sum(map(len, self.parent.right)))
-        self.parent._right._strand = DANGLING
-        self.parent._right = EMPTY
-
-    def dispatch_weight(self, delta):
-        self.parent.strand.dispatch_weight(delta)
-
-    def attach(self, child):
-        self.parent.right = child
-
-
-# Sentinel objects for missing leaves and half-strands respectively.
+# Sentinel object for missing leaves.
 EMPTY = sentinel(
     name='RopeSentinel',
     repr='EMPTY',
     abc=RopeNode,
     methods={ 'copy': lambda self: self },
-    attrs={ '_weight': 0, 'height': 0 },
-)
-
-DANGLING = sentinel(
-    name='HalfStrand',
-    repr='DANGLING',
-    abc=Strand,
-    attrs={ 'parent': EMPTY }
+    attrs={ '_is_left': False, '_length': 0, 'height': 0 },
 )
 
-object.__setattr__(EMPTY, '_strand', DANGLING)
+object.__setattr__(EMPTY, '_parent', EMPTY)
 
 
 class RopeInternal(RopeNode):
     """Internal node of a Rope.
     """
-    __slots__ = '_left', '_right',
+    __slots__ = '_left', '_right', '_height',
 
     def __init__(self, left=EMPTY, right=EMPTY):
         super().__init__()
         self._left = self._right = EMPTY
+        self._height = 1
         self.left = left
         self.right = right
 
@@ -158,9 +137,7 @@ class RopeInternal(RopeNode):
 
     @left.setter
     def left(self, node):
-        self._left.strand.cut()
-        self._left = node or EMPTY
-        self._left.strand = LeftStrand(self)
+        self._attach(node, is_left=True)
 
     @property
     def right(self):
@@ -168,14 +145,58 @@ class RopeInternal(RopeNode):
 
     @right.setter
     def right(self, node):
-        self._right.strand.cut()
-        self._right = node or EMPTY
-        self._right.strand = RightStrand(self)
+        self._attach(node, is_left=False)
+
+    @property
+    def weight(self):
+        return self._left._length
+
+    @property
+    def trunk(self):
+        """This node or, if one of its children is empty, the other child.
+        """
+        if not self._left._length:
+            return self._right
+
+        if not self._right._length:
+            return self._left
+
+        return self
+
+    def _attach(self, node, is_left):
+        """Make `node` the left or right child of this node, cutting it from its current parent.
+        """
+        old = self._left if is_left else self._right
+        old._parent = EMPTY
+        old_length = old._length
+
+        node = node or EMPTY
+        node.detach()
+        node._parent = self
+        node._is_left = is_left
+
+        if is_left:
+            self._left = node
+        else:
+            self._right = node
+
+        self._dispatch_length(node._length - old_length)
+        self._update_height()
+
+    def _update_height(self):
+        """Recompute the height of this node and of each ancestor whose height changes as a result.
+        """
+        node = self
+        while node is not EMPTY:
+            height = max(node._left.height, node._right.height) + 1
+            if height == node._height:
+                return
+
+            node._height = height
+            node = node._parent
 
     @property
     def balance(self):
-        # For AVL trees one can keep this updated as nodes are inserted, but Ropes can be joined arbitrarily
-        # which complicates the matter.  For now we'll make do with recalculating as needed:
         return self.left.height - self.right.height
 
     def collapse(self):
@@ -187,17 +208,17 @@ class RopeInternal(RopeNode):
         if isinstance(self.right, RopeInternal):
             self.right.collapse()
 
-        if self.strand is DANGLING:  # Special case for root.
+        if self.parent is EMPTY:  # Special case for root.
             return
 
         if not self.left:
-            self.strand.attach(self.right)
+            self.replace(self.right)
         elif not self.right:
-            self.strand.attach(self.left)
+            self.replace(self.left)
 
     @property
     def height(self):
-        return max(self.left.height, self.right.height) + 1
+        return self._height
 
     def iter_nodes(self):
         yield self
@@ -271,10 +292,10 @@ class RopeLeaf(RopeNode):
     @sequence.setter
     def sequence(self, seq):
         self._sequence = seq
-        self.weight = len(seq)
+        self._dispatch_length(len(seq) - self._length)
 
     def __bool__(self):
-        return bool(self.weight)
+        return bool(self._length)
 
     @property
     def height(self):
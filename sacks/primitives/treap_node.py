@@ -0,0 +1,115 @@
+from random import random
+
+from .bst_node import BSTNode
+from .sentinel import sentinel
+
+
+def rotate_right(root):
+    pivot = root.left
+    root.left = pivot.right
+    pivot.right = root
+
+    root.update()
+    pivot.update()
+
+    return pivot
+
+def rotate_left(root):
+    pivot = root.right
+    root.right = pivot.left
+    pivot.left = root
+
+    root.update()
+    pivot.update()
+
+    return pivot
+
+def split(root, key):
+    """Split the treap at `root` into treaps of keys less than `key` and keys greater or equal to `key`.
+    """
+    if not root:
+        return EMPTY, EMPTY
+
+    if root.key < key:
+        root.right, right = split(root.right, key)
+        root.update()
+        return root, right
+
+    left, root.left = split(root.left, key)
+    root.update()
+    return left, root
+
+def merge(left, right):
+    """Merge the treaps at `left` and `right`.  No key of `right` may be less than a key of `left`.
+    """
+    if not left:
+        return right
+
+    if not right:
+        return left
+
+    if left.priority > right.priority:
+        left.right = merge(left.right, right)
+        left.update()
+        return left
+
+    right.left = merge(left, right.left)
+    right.update()
+    return right
+
+
+class TreapNode(BSTNode):
+    """Primitive of a treap.  Nodes are heap-ordered by a random `priority` and track the `size` of their subtree.
+    """
+    __slots__ = 'priority', 'size',
+
+    def __init__(self, key):
+        self.key = key
+        self.left = self.right = EMPTY
+        self.priority = random()
+        self.size = 1
+
+    def update(self):
+        """Recompute data aggregated from this node's children.
+        """
+        self.size = self.left.size + self.right.size + 1
+
+    def add_key(self, key):
+        if key < self.key:
+            self.left = self.left.add_key(key)
+            if self.left.priority > self.priority:
+                return rotate_right(self)
+        else:
+            self.right = self.right.add_key(key)
+            if self.right.priority > self.priority:
+                return rotate_left(self)
+
+        self.size += 1
+        return self
+
+    def remove_key(self, key):
+        if key < self.key:
+            self.left = self.left.remove_key(key)
+        elif self.key < key:
+            self.right = self.right.remove_key(key)
+        else:
+            return merge(self.left, self.right)
+
+        self.size -= 1
+        return self
+
+
+EMPTY = sentinel(
+    name='TreapEmptyNode',
+    repr='EMPTY',
+    methods={
+        '__contains__': lambda self, key: False,
+        '__iter__': 'default_iter',
+        '__reversed__': 'default_iter',
+        'add_key': TreapNode,
+        'remove_key': KeyError,
+    },
+    attrs={
+        'size': 0,
+    },
+)
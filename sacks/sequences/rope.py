@@ -1,4 +1,5 @@
-from collections.abc import MutableSequence
+from collections.abc import Iterator, MutableSequence
+from functools import reduce
 
 from ..primitives.rope_nodes import RopeInternal, RopeLeaf
 
@@ -52,9 +53,198 @@ def balance(root, recursive=True):
 
     return root
 
+def concat(left, right):
+    """
+    Return a tree whose leaves are those of `left` followed by those of `right`.  The shorter tree is hung from the
+    spine of the taller at a node of about its height, and the spine is rebalanced on the way back up (as in an AVL
+    join), so the result is at most one level taller than the taller tree.
+    """
+    left.detach()
+    right.detach()
+
+    if left.height > right.height + 1:
+        node = left
+        while node.height > right.height + 1:
+            node = node.right
+
+        parent = node.parent
+        parent.right = RopeInternal(node, right)
+    elif right.height > left.height + 1:
+        node = right
+        while node.height > left.height + 1:
+            node = node.left
+
+        parent = node.parent
+        parent.left = RopeInternal(left, node)
+    else:
+        return RopeInternal(left, right)
+
+    while True:
+        grandparent, is_left = parent.parent, parent.is_left_child
+        parent = balance(parent, recursive=False)
+        if not grandparent:
+            return parent
+
+        if is_left:
+            grandparent.left = parent
+        else:
+            grandparent.right = parent
+
+        parent = grandparent
+
+def cover(node, start, stop, pieces):
+    """
+    Append to `pieces` the subtrees of `node` that exactly cover the range `start:stop`.  Leaves that straddle
+    the range are sliced.
+    """
+    if isinstance(node, RopeInternal) and not (node.left.length and node.right.length):  # e.g., a short rope's root
+        if node.length:
+            cover(node.trunk, start, stop, pieces)
+        return
+
+    if start <= 0 and stop >= node.length:
+        pieces.append(node)
+        return
+
+    if isinstance(node, RopeLeaf):
+        pieces.append(RopeLeaf(node.sequence[start:stop]))
+        return
+
+    weight = node.weight
+    if start < weight:
+        cover(node.left, start, min(stop, weight), pieces)
+    if stop > weight:
+        cover(node.right, max(start - weight, 0), stop - weight, pieces)
+
+def next_leaf(node):
+    """Return the leaf following `node` or None if `node` is right-most.
+    """
+    while True:
+        parent = node.parent
+        if not parent:
+            return None
+
+        if node.is_left_child and parent.right.length:
+            node = parent.right
+            break
+
+        node = parent
+
+    while isinstance(node, RopeInternal):
+        node = node.left if node.left.length else node.right
+
+    return node
+
+def prev_leaf(node):
+    """Return the leaf preceding `node` or None if `node` is left-most.
+    """
+    while True:
+        parent = node.parent
+        if not parent:
+            return None
+
+        if not node.is_left_child and parent.left.length:
+            node = parent.left
+            break
+
+        node = parent
+
+    while isinstance(node, RopeInternal):
+        node = node.right if node.right.length else node.left
+
+    return node
+
+
+class Cursor(Iterator):
+    """
+    A movable position in a rope.  Seeking descends the tree once, after which advancing moves from leaf to
+    leaf in amortized O(1) per item.  Iterating a cursor yields items while advancing it.
+
+    Warning
+    -------
+    Any modification of the rope invalidates the cursor.  Call `seek` to reposition it.
+
+    """
+    __slots__ = 'rope', '_leaf', '_offset', '_index',
+
+    def __init__(self, rope, index=0):
+        self.rope = rope
+        self.seek(index)
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def value(self):
+        """The item at the cursor.
+        """
+        if self._index == len(self.rope):
+            raise IndexError('cursor at end of rope')
+
+        return self._leaf.sequence[self._offset]
+
+    def seek(self, index):
+        """Move the cursor to `index`.  `index` can be `len(rope)`, one past the last item.
+        """
+        n = len(self.rope)
+
+        if index < -n or index > n:
+            raise IndexError(f'index {index} out of range')
+
+        if index < 0:
+            index += n
+
+        self._index = index
+
+        if n == 0:
+            self._leaf, self._offset = None, 0
+        elif index == n:
+            self._leaf, self._offset = self.rope.root.query(n - 1)
+            self._offset += 1
+        else:
+            self._leaf, self._offset = self.rope.root.query(index)
+
+    def advance(self, n=1):
+        """Move the cursor `n` items (backwards if `n` is negative).
+        """
+        index = self._index + n
+        if index < 0 or index > len(self.rope):
+            raise IndexError(f'index {index} out of range')
+
+        if not n:
+            return
+
+        self._index = index
+
+        leaf = self._leaf
+        offset = self._offset + n
+
+        while offset < 0:
+            leaf = prev_leaf(leaf)
+            offset += len(leaf.sequence)
 
-# We aren't inheriting from AVLTree as we haven't implemented the bulk operations `join`, `split`, `union`. (Ropes can be joined arbitrarily.)
-# Currently, balancing must be done manually by calling `rebalance`.
+        while offset >= len(leaf.sequence) and (following := next_leaf(leaf)):
+            offset -= len(leaf.sequence)
+            leaf = following
+
+        self._leaf = leaf
+        self._offset = offset
+
+    def __next__(self):
+        if self._index == len(self.rope):
+            raise StopIteration
+
+        value = self.value
+        self.advance()
+        return value
+
+    def __repr__(self):
+        return f'{type(self).__name__}(index={self._index})'
+
+
+# We aren't inheriting from AVLTree: its `join` and `split` (see `sets.avl_tree`) are keyed, while ropes split by
+# position and store sequences only in leaves. Currently, balancing must be done manually by calling `rebalance`.
 # TODO: Keep track of how "messy" a tree is so we can coalesce many short leaves and rebalance.
 
 class Rope(MutableSequence):
@@ -112,6 +302,30 @@ class Rope(MutableSequence):
         for seq in self._root:
             yield from seq
 
+    def __reversed__(self):
+        if self:
+            yield from self.iter_from(-1, reverse=True)
+
+    def iter_from(self, index, reverse=False):
+        """Yield items starting at `index`, moving right (or left if `reverse` is true) until the end of the rope.
+        """
+        index, _ = self._normalize_index(index)
+        leaf, offset = self._root.query(index)
+
+        if reverse:
+            yield from reversed(leaf.sequence[:offset + 1])
+            while leaf := prev_leaf(leaf):
+                yield from reversed(leaf.sequence)
+        else:
+            yield from leaf.sequence[offset:]
+            while leaf := next_leaf(leaf):
+                yield from leaf.sequence
+
+    def cursor(self, index=0):
+        """Return a `Cursor` positioned at `index`.
+        """
+        return Cursor(self, index)
+
     def reduce(self):
         """A monolithic sum of all the leaves of this rope.
         """
@@ -167,29 +381,23 @@ class Rope(MutableSequence):
 
     def __getitem__(self, key):
         start, length = self._normalize_index(key)
+
+        if isinstance(key, int):
+            leaf, i = self._root.query(start)
+            return leaf.sequence[i]
+
         it = self._root.slice(start, length)
         if self.type is str:
             return ''.join(it)
         return self.type(it)
 
     def __setitem__(self, key, sequence):
-        first_split, second_split = self._normalize_index(key)
-
-        _, other = self.split(first_split)
-        _, end = other.split(second_split)
-
-        self.join(Rope(sequence, leafsize=self.leafsize))
-        self.join(end)
-        self.collapse()
+        start, length = self._normalize_index(key)
+        self.apply_edits([ (start, start + length, sequence) ])
 
     def __delitem__(self, key):
-        first_split, second_split = self._normalize_index(key)
-
-        _, other = self.split(first_split)
-        _, end = other.split(second_split)
-
-        self.join(end)
-        self.collapse()
+        start, length = self._normalize_index(key)
+        self.apply_edits([ (start, start + length, None) ])
 
     def __add__(self, other):
         if self.type != other.type:
@@ -222,42 +430,98 @@ class Rope(MutableSequence):
         if self.type != other.type:
             raise TypeError(f'Incompatible types: {self.type}, {other.type}')
 
-        balance = self._root.height - other._root.height
+        if not other:
+            return
 
-        if balance < -1:
-            self._join_right(other, balance)
-        elif balance > 1:
-            self._join_left(other, balance)
+        if self:
+            self._set_root(concat(self._root.trunk, other._root.trunk))
         else:
-            self._root = RopeInternal(self._root, other._root)
+            self._root = other._root
 
         self._len += len(other)
 
-    def _join_right(self, other, balance):
-        left_most = other._root
-        while balance < 0 and isinstance(left_most, RopeInternal):
-            left_most = left_most.left
-            balance += 1
+    def insert(self, index, sequence):
+        """Insert sequence before `index`.
+        """
+        index, _ = self._normalize_index(index)
+        self.apply_edits([ (index, index, sequence) ])
 
-        left_most.strand.attach( RopeInternal(self._root, left_most) )
-        self._root = other._root
+    def apply_edits(self, edits):
+        """
+        Apply a batch of edits in a single pass.  Each edit is a triple `(start, stop, sequence)` that replaces
+        `self[start:stop]` with `sequence` (`None` or an empty sequence deletes).  `start == stop` inserts.
 
-    def _join_left(self, other, balance):
-        right_most = self._root
-        while balance > 0 and isinstance(right_most, RopeInternal):
-            right_most = right_most.right
-            balance -= 1
+        Notes
+        -----
+        Indices refer to the rope *before* any edit is applied, so edits can be given in any order, but they
+        mustn't overlap.  Edits are sorted, untouched subtrees are reused as-is, and only the spine joining
+        them is rebuilt, once, instead of once per edit.  Pieces are joined by height, so the rope stays
+        balanced however many edits land in the same place.
 
-        right_most.strand.attach( RopeInternal(right_most, other._root) )
+        Raises
+        ------
+        TypeError if a sequence isn't of this rope's type.
+
+        ValueError if two edits overlap.
 
-    def insert(self, index, sequence):
-        """Insert sequence before `index`.
         """
-        index, _ = self._normalize_index(index)
+        length = new_length = self._len
+        normalized = [ ]
+        for start, stop, sequence in edits:
+            if sequence is not None and type(sequence) != self.type:
+                raise TypeError(f'Incompatible types: {self.type}, {type(sequence)}')
+
+            start, stop, _ = slice(start, stop).indices(length)
+            normalized.append((start, max(start, stop), sequence))
+        normalized.sort(key=lambda edit: edit[:2])
+
+        pieces = [ ]
+        position = 0
+        for start, stop, sequence in normalized:
+            if start < position:
+                raise ValueError(f'overlapping edits at index {start}')
+
+            if position < start:
+                cover(self._root, position, start, pieces)
+
+            if sequence:
+                leafsize = self.leafsize
+                pieces.append(
+                    self._from_nodes([ RopeLeaf(sequence[i:i + leafsize]) for i in range(0, len(sequence), leafsize) ])
+                )
+
+            new_length += len(sequence or ()) - (stop - start)
+            position = stop
+
+        if position < length:
+            cover(self._root, position, length, pieces)
+
+        if pieces:
+            self._set_root(reduce(concat, pieces))
+        else:
+            self._root = self._from_sequence(self.type())
+        self._len = new_length
 
-        _, end = self.split(index)
-        self.join(Rope(sequence, leafsize=self.leafsize))
-        self.join(end)
+    def _set_root(self, node):
+        """Make `node` the root of this rope.  A leaf is wrapped, as the root must be an internal node.
+        """
+        if isinstance(node, RopeInternal):
+            node.detach()
+            self._root = node
+        else:
+            self._root = RopeInternal(node)
+
+    def _from_nodes(self, nodes):
+        """Build a balanced tree whose leaves, in order, are `nodes`.
+        """
+        if len(nodes) == 1:
+            return nodes[0]
+
+        half = sum(divmod(len(nodes), 2))
+        return RopeInternal(
+            self._from_nodes( nodes[:half] ),
+            self._from_nodes( nodes[half:] ),
+        )
 
     def split(self, index):
         """Split the rope at `index`.  Return both ends of split.
@@ -1,8 +1,11 @@
 from .avl_tree import AVLTree
+from .b_plus_tree import BPlusTree
 from .binary_search_tree import BinarySearchTree
 from .bloom_filter import BloomFilter
 from .disjoint_set_forest import DisjointSetForest, DisjointSetForest as UnionFind  # alias
+from .interval_tree import IntervalTree
 from .multisetch import MultiSetch
 from .ordered_set import OrderedSet
 from .partition_refinement import PartitionRefinement
 from .setch import Setch
+from .treap import Treap
@@ -1,5 +1,6 @@
 from .binary_search_tree import BinarySearchTree
-from ..primitives.avl_node import EMPTY
+from .order_statistics import OrderStatistics
+from ..primitives.avl_node import AVLNode, EMPTY
 
 def rotate_right(root):
     r"""
@@ -15,8 +16,11 @@ def rotate_right(root):
     root.left = pivot.right
     pivot.right = root
 
-    root.balance -= 1 + pivot.balance  # Note pivot.balance >= 0
-    pivot.balance -= 1
+    root.balance -= 1 + max(pivot.balance, 0)
+    pivot.balance -= 1 - min(root.balance, 0)
+
+    root.update()
+    pivot.update()
 
     return pivot
 
@@ -34,8 +38,11 @@ def rotate_left(root):
     root.right = pivot.left
     pivot.left = root
 
-    root.balance += 1 - pivot.balance  # Note pivot.balance <= 0
-    pivot.balance += 1
+    root.balance += 1 - min(pivot.balance, 0)
+    pivot.balance += 1 + max(root.balance, 0)
+
+    root.update()
+    pivot.update()
 
     return pivot
 
@@ -49,10 +56,228 @@ def balance(root):
         root.right = rotate_right(root.right)
     return rotate_left(root)
 
+def height(root):
+    """Height of the tree at `root` in O(log n) (by following the taller side down).
+    """
+    h = 0
+    while root:
+        h += 1
+        root = root.left if root.balance >= 0 else root.right
+    return h
+
+def update_path(node):
+    """Update aggregated data of `node` and all its ancestors.
+    """
+    while node:
+        node.update()
+        node = node.parent
+
+def retrace(node, is_left, delta):
+    """
+    Update balance factors going up from `node` after the height of its left (if `is_left`) or right subtree
+    changed by `delta` (1 or -1), rotating where necessary.
+
+    Return the highest node reached and whether the height of its subtree changed.
+    """
+    while True:
+        node.balance += delta if is_left else -delta
+
+        if node.balance in (-2, 2):
+            parent, was_left = node.parent, node.is_left_child
+            node = balance(node)
+
+            if not parent:
+                node.parent = EMPTY
+            elif was_left:
+                parent.left = node
+            else:
+                parent.right = node
+
+        if (node.balance == 0) == (delta == 1):
+            return node, False
+
+        if not node.parent:
+            return node, True
+
+        node, is_left = node.parent, node.is_left_child
+
+def _join(left, hl, node, right, hr):
+    """`join` with known heights.  Return the new root and its height.
+    """
+    if hl > hr + 1:  # Insert `node` on the right spine of `left`.
+        parent, current, h = EMPTY, left, hl
+        while h > hr + 1:
+            h -= 1 if current.balance <= 0 else 2
+            parent, current = current, current.right
+
+        node.left = current
+        node.right = right
+        node.balance = h - hr
+        parent.right = node
+        update_path(node)
+
+        top, grew = retrace(parent, False, 1)
+        return (left, hl) if top.parent else (top, hl + grew)
+
+    if hr > hl + 1:  # Insert `node` on the left spine of `right`.
+        parent, current, h = EMPTY, right, hr
+        while h > hl + 1:
+            h -= 1 if current.balance >= 0 else 2
+            parent, current = current, current.left
+
+        node.right = current
+        node.left = left
+        node.balance = hl - h
+        parent.left = node
+        update_path(node)
+
+        top, grew = retrace(parent, True, 1)
+        return (right, hr) if top.parent else (top, hr + grew)
+
+    node.left = left
+    node.right = right
+    node.balance = hl - hr
+    node.parent = EMPTY
+    node.update()
+    return node, max(hl, hr) + 1
+
+def _join2(left, hl, right, hr):
+    """Join two trees without a middle node.  Return the new root and its height.
+    """
+    if not left:
+        return right, hr
+
+    if not right:
+        return left, hl
 
-# TODO: Implement join, split, union bulk operations. :class: Rope can inherit from AVLTree once implemented.
+    node, right, hr = _split_first(right, hr)
+    return _join(left, hl, node, right, hr)
 
-class AVLTree(BinarySearchTree):
+def _split_first(root, h):
+    """Remove the least node of the tree at `root`.  Return that node, the new root and its height.
+    """
+    left, right = root.left, root.right
+    hl = h - 1 if root.balance >= 0 else h - 2
+    hr = h - 1 if root.balance <= 0 else h - 2
+
+    if not left:
+        right.parent = EMPTY
+        return root, right, hr
+
+    left.parent = right.parent = EMPTY
+    first, left, hl = _split_first(left, hl)
+    return (first, *_join(left, hl, root, right, hr))
+
+def _split(root, h, key, inclusive=False):
+    """`split` with a known height.  Return both roots and their heights.
+    """
+    if not root:
+        return EMPTY, 0, EMPTY, 0
+
+    left, right = root.left, root.right
+    hl = h - 1 if root.balance >= 0 else h - 2
+    hr = h - 1 if root.balance <= 0 else h - 2
+    left.parent = right.parent = EMPTY
+
+    if not key < root.key if inclusive else root.key < key:
+        rl, hrl, rr, hrr = _split(right, hr, key, inclusive)
+        return (*_join(left, hl, root, rl, hrl), rr, hrr)
+
+    ll, hll, lr, hlr = _split(left, hl, key, inclusive)
+    return (ll, hll, *_join(lr, hlr, root, right, hr))
+
+def _union(a, ha, b, hb):
+    """Return the root and height of the union of the trees at `a` and `b`.
+    """
+    if not b:
+        return a, ha
+    if not a:
+        return b, hb
+
+    left, right = a.left, a.right
+    hl = ha - 1 if a.balance >= 0 else ha - 2
+    hr = ha - 1 if a.balance <= 0 else ha - 2
+    left.parent = right.parent = EMPTY
+
+    bl, hbl, br, hbr = _split(b, hb, a.key)
+    left, hl = _union(left, hl, bl, hbl)
+    right, hr = _union(right, hr, br, hbr)
+    return _join(left, hl, a, right, hr)
+
+def _filter(a, ha, b, hb, keep_common):
+    """
+    Return the root and height of the tree of keys of `a` that are in `b` (if `keep_common`) or that aren't
+    in `b` (otherwise), and the number of keys of `a` that are in `b`.
+    """
+    if not a or not b:
+        return (EMPTY, 0, 0) if keep_common else (a, ha, 0)
+
+    key = b.key
+    hbl = hb - 1 if b.balance >= 0 else hb - 2
+    hbr = hb - 1 if b.balance <= 0 else hb - 2
+    b.left.parent = b.right.parent = EMPTY
+
+    less, hless, rest, hrest = _split(a, ha, key)
+    equal, hequal, greater, hgreater = _split(rest, hrest, key, inclusive=True)
+
+    left, hl, nl = _filter(less, hless, b.left, hbl, keep_common)
+    right, hr, nr = _filter(greater, hgreater, b.right, hbr, keep_common)
+    n = nl + nr + equal.size
+
+    if keep_common:
+        left, hl = _join2(left, hl, equal, hequal)
+
+    return (*_join2(left, hl, right, hr), n)
+
+def join(left, node, right):
+    """
+    Join the trees at `left` and `right` with `node` between them and return the new root.  Every key in `left`
+    must be no greater than `node.key`, which must be no greater than any key in `right`.  O(log n)
+    """
+    root, _ = _join(left, height(left), node, right, height(right))
+    return root
+
+def split(root, key):
+    """Split the tree at `root` into the roots of trees with keys less than `key` and keys not less than `key`. O(log n)
+    """
+    left, _, right, _ = _split(root, height(root), key)
+    return left, right
+
+def copy(root):
+    """Return a copy of the tree at `root`.
+    """
+    if not root:
+        return EMPTY
+
+    node = type(root)(root.key)
+    node.left = copy(root.left)
+    node.right = copy(root.right)
+    node.balance = root.balance
+    node.update()
+    return node
+
+def build(keys, lo, hi, node_type=AVLNode):
+    """
+    Return the root of a perfectly balanced tree of `node_type` nodes from the sorted sequence `keys[lo:hi]`.
+
+    Notes
+    -----
+    A subtree of n nodes built this way has height `n.bit_length()`, which gives each node's balance directly.
+
+    """
+    if lo == hi:
+        return EMPTY
+
+    mid = (lo + hi) // 2
+    node = node_type(keys[mid])
+    node.left = build(keys, lo, mid, node_type)
+    node.right = build(keys, mid + 1, hi, node_type)
+    node.balance = (mid - lo).bit_length() - (hi - mid - 1).bit_length()
+    node.update()
+    return node
+
+
+class AVLTree(OrderStatistics, BinarySearchTree):
     """
     A self-balancing binary search tree.
 
@@ -60,51 +285,140 @@ class AVLTree(BinarySearchTree):
     -----
     This version of an AVL tree allows multiple of the same item to be inserted.
 
+    Order statistics (`select`, `rank`, `count_range` and indexing) are O(log n).
+
+    Union, intersection and difference with another AVLTree are done with `join` and `split` in
+    O(m log(n / m + 1)) for trees of sizes m <= n.
+
     """
     __slots__ = ()
 
-    def __init__(self, iterable=()):
-        self._root = EMPTY
-        self._len = 0
+    _node_type = AVLNode
+
+    @staticmethod
+    def _build(keys):
+        return build(keys, 0, len(keys))
 
-        self |= iterable
+    def _can_meld(self, other):
+        """Whether `other` is an AVLTree whose nodes can be joined with this tree's.
+        """
+        return isinstance(other, AVLTree) and other._node_type is self._node_type
 
     @property
     def balance(self):
         return self._root.balance
 
-    def rebalance(self, root, delta):
-        """Rebalance the tree after a node addition or removal. (`delta` will be 1 for addition and -1 for removal.)
+    def rebalance(self, node, is_left, delta):
         """
-        if not root:
-            return
-
-        if root is self._root:
-            if root.balance in (-2, 2):
-                self._root = balance(root)
-                self._root.parent = EMPTY
-            return
-
-        if root.balance in (-2, 2):
-            parent = root.parent
-            if root.is_left_child:
-                new_root = parent.left = balance(root)
-            else:
-                new_root = parent.right = balance(root)
-
-            return self.rebalance(new_root, delta) if delta == -1 else None  # Keep recursing if node was deleted.
-
-        root.parent.balance += delta if root.is_left_child else -delta
-
-        if delta == 1 and root.parent.balance != 0 or delta == -1 and root.parent.balance not in (1, -1):
-            self.rebalance(root.parent, delta)
+        Rebalance the tree after the height of the left (if `is_left`) or right subtree of `node` changed by `delta`.
+        (`delta` will be 1 for addition and -1 for removal.)
+        """
+        top, _ = retrace(node, is_left, delta)
+        if not top.parent:
+            self._root = top
 
     def add(self, item):
         self._root, new_node = self._root.add_key(item)
         self._len += 1
-        self.rebalance(new_node, delta=1)
+
+        if parent := new_node.parent:
+            self.rebalance(parent, new_node.is_left_child, 1)
 
     def remove(self, item):
-        self._root, unbalanced_node = self._root.remove_key(item)
+        self._root, parent, is_left = self._root.remove_key(item)
+        self._root.parent = EMPTY
         self._len -= 1
-        self.rebalance(unbalanced_node, delta=-1)
+
+        if parent:
+            self.rebalance(parent, is_left, -1)
+
+    def copy(self):
+        """Return a copy of this tree.
+        """
+        tree = type(self)()
+        tree._root = copy(self._root)
+        tree._len = self._len
+        return tree
+
+    def join(self, other):
+        """
+        Move all items of `other` to the end of this tree.  O(log n)
+
+        Warning
+        -------
+        This is destructive.  `other` will be empty afterwards.
+
+        Raises
+        ------
+        TypeError if `other` is an AVLTree of a different kind of node (e.g., an IntervalTree).
+
+        ValueError if an item of `other` is less than an item of this tree.
+
+        """
+        if not self._can_meld(other):
+            raise TypeError(f'cannot join {type(other).__name__} to {type(self).__name__}')
+
+        if self and other and other.min < self.max:
+            raise ValueError('items of other must not be less than items of this tree')
+
+        self._root, _ = _join2(self._root, height(self._root), other._root, height(other._root))
+        self._len += other._len
+
+        other._root = EMPTY
+        other._len = 0
+
+    def split(self, item):
+        """Keep items less than `item` in this tree and move the rest to a new tree.  Return both trees. O(log n)
+        """
+        right = type(self)()
+        self._root, right._root = split(self._root, item)
+        right._len = right._root.size
+        self._len -= right._len
+        return self, right
+
+    def __ior__(self, other):
+        if not self._can_meld(other):
+            return super().__ior__(other)
+
+        self._root, _ = _union(self._root, height(self._root), copy(other._root), height(other._root))
+        self._len += other._len
+        return self
+
+    def __iand__(self, other):
+        if not self._can_meld(other):
+            return super().__iand__(other)
+
+        self._root, _, self._len = _filter(self._root, height(self._root), copy(other._root), height(other._root), True)
+        return self
+
+    def __isub__(self, other):
+        if not self._can_meld(other):
+            return super().__isub__(other)
+
+        self._root, _, removed = _filter(self._root, height(self._root), copy(other._root), height(other._root), False)
+        self._len -= removed
+        return self
+
+    def __or__(self, other):
+        if not isinstance(other, AVLTree):
+            return super().__or__(other)
+
+        tree = self.copy()
+        tree |= other
+        return tree
+
+    def __and__(self, other):
+        if not isinstance(other, AVLTree):
+            return super().__and__(other)
+
+        tree = self.copy()
+        tree &= other
+        return tree
+
+    def __sub__(self, other):
+        if not isinstance(other, AVLTree):
+            return super().__sub__(other)
+
+        tree = self.copy()
+        tree -= other
+        return tree
@@ -0,0 +1,324 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import MutableSet, Reversible
+from itertools import groupby
+
+from .binary_search_tree import NO_DEFAULT
+from ..primitives.b_plus_node import BPlusInternal, BPlusLeaf
+
+
+def even_bounds(n, fill, least):
+    """
+    Return the boundaries of near-equal chunks covering `n` items.  Chunks hold about `fill` items, but no fewer
+    than `least` if there is more than one chunk.
+    """
+    k = max(min(-(-n // fill), n // least), 1)
+    return [ n * i // k for i in range(k + 1) ]
+
+def bulk_load(keys, order):
+    """Return the root and height of a B+ tree of the given `order` containing the sorted, distinct `keys`.
+    """
+    if not keys:
+        return BPlusLeaf(), 0
+
+    least = order >> 1
+    fill = max(order * 3 >> 2, least + 1)
+
+    bounds = even_bounds(len(keys), fill, least)
+    level = [ BPlusLeaf(keys[a:b]) for a, b in zip(bounds, bounds[1:]) ]
+    mins = [ keys[a] for a in bounds[:-1] ]
+
+    for left, right in zip(level, level[1:]):
+        left.next = right
+        right.prev = left
+
+    height = 0
+    while len(level) > 1:
+        bounds = even_bounds(len(level), fill + 1, least + 1)
+        level, mins = (
+            [ BPlusInternal(mins[a + 1:b], level[a:b]) for a, b in zip(bounds, bounds[1:]) ],
+            [ mins[a] for a in bounds[:-1] ],
+        )
+        height += 1
+
+    return level[0], height
+
+
+class BPlusTree(MutableSet, Reversible):
+    """
+    An ordered set with O(log n) containment, addition and deletion of items.  Keys are stored in wide, sorted
+    leaves linked to their neighbors.
+
+    Parameters
+    ----------
+    iterable : Iterable, default: ()
+        Initial items of the set.
+    order : int, default: DEFAULT_ORDER
+        Maximum number of keys in a node.  Nodes other than the root hold at least `order // 2` keys.
+
+    Notes
+    -----
+    Unlike AVLTree, a BPlusTree is a true set: adding an item already in the tree does nothing.
+
+    Each level of the tree is searched with `bisect` over a plain list, so a lookup costs a handful of Python
+    objects and C-level comparisons instead of one node per level of a binary tree.  Iteration and `irange`
+    walk the linked leaves.
+
+    """
+    __slots__ = '_root', '_len', '_height', '_order',
+
+    DEFAULT_ORDER = 64
+
+    def __init__(self, iterable=(), *, order=DEFAULT_ORDER):
+        if order < 3:
+            raise ValueError('order must be at least 3')
+
+        self._order = order
+
+        keys = [ key for key, _ in groupby(sorted(iterable)) ]
+        self._root, self._height = bulk_load(keys, order)
+        self._len = len(keys)
+
+    @property
+    def root(self):
+        return self._root
+
+    @property
+    def order(self):
+        return self._order
+
+    @property
+    def height(self):
+        return self._height
+
+    def _first_leaf(self):
+        node = self._root
+        for _ in range(self._height):
+            node = node.children[0]
+
+        return node
+
+    def _last_leaf(self):
+        node = self._root
+        for _ in range(self._height):
+            node = node.children[-1]
+
+        return node
+
+    def _leaf(self, item):
+        """Return the leaf in which `item` belongs.
+        """
+        node = self._root
+        for _ in range(self._height):
+            node = node.children[bisect_right(node.keys, item)]
+
+        return node
+
+    @property
+    def min(self):
+        if not self:
+            raise ValueError('tree is empty')
+
+        return self._first_leaf().keys[0]
+
+    @property
+    def max(self):
+        if not self:
+            raise ValueError('tree is empty')
+
+        return self._last_leaf().keys[-1]
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, item):
+        keys = self._leaf(item).keys
+        i = bisect_left(keys, item)
+        return i < len(keys) and keys[i] == item
+
+    def __iter__(self):
+        leaf = self._first_leaf()
+        while leaf is not None:
+            yield from leaf.keys
+            leaf = leaf.next
+
+    def __reversed__(self):
+        leaf = self._last_leaf()
+        while leaf is not None:
+            yield from reversed(leaf.keys)
+            leaf = leaf.prev
+
+    def add(self, item):
+        path = [ ]
+        node = self._root
+        for _ in range(self._height):
+            i = bisect_right(node.keys, item)
+            path.append((node, i))
+            node = node.children[i]
+
+        keys = node.keys
+        i = bisect_left(keys, item)
+        if i < len(keys) and keys[i] == item:
+            return
+
+        keys.insert(i, item)
+        self._len += 1
+
+        order = self._order
+        while len(node.keys) > order:
+            sep, sibling = node.split()
+
+            if not path:
+                self._root = BPlusInternal([ sep ], [ node, sibling ])
+                self._height += 1
+                return
+
+            node, i = path.pop()
+            node.keys.insert(i, sep)
+            node.children.insert(i + 1, sibling)
+
+    def remove(self, item):
+        path = [ ]
+        node = self._root
+        for _ in range(self._height):
+            i = bisect_right(node.keys, item)
+            path.append((node, i))
+            node = node.children[i]
+
+        keys = node.keys
+        i = bisect_left(keys, item)
+        if i == len(keys) or keys[i] != item:
+            raise KeyError(item)
+
+        del keys[i]
+        self._len -= 1
+
+        least = self._order >> 1
+        while path and len(node.keys) < least:
+            parent, i = path.pop()
+            seps, children = parent.keys, parent.children
+
+            if i and len((left := children[i - 1]).keys) > least:
+                seps[i - 1] = node.borrow_left(left, seps[i - 1])
+                return
+
+            if i < len(seps) and len((right := children[i + 1]).keys) > least:
+                seps[i] = node.borrow_right(right, seps[i])
+                return
+
+            if i:  # Merge into left sibling.
+                i -= 1
+                children[i].merge(node, seps[i])
+            else:  # Merge right sibling into this node.
+                node.merge(children[i + 1], seps[i])
+
+            del seps[i]
+            del children[i + 1]
+            node = parent
+
+        if self._height and not self._root.keys:
+            self._root = self._root.children[0]
+            self._height -= 1
+
+    def discard(self, item):
+        try:
+            self.remove(item)
+        except KeyError:
+            pass
+
+    def clear(self):
+        self._root = BPlusLeaf()
+        self._height = 0
+        self._len = 0
+
+    def floor(self, item, default=NO_DEFAULT):
+        """
+        Return the greatest item less than or equal to `item`.  If there is no such item return `default` if
+        provided else raise KeyError.
+        """
+        leaf = self._leaf(item)
+        if i := bisect_right(leaf.keys, item):
+            return leaf.keys[i - 1]
+
+        return self._nearest(leaf.prev, -1, item, default)
+
+    def ceiling(self, item, default=NO_DEFAULT):
+        """
+        Return the least item greater than or equal to `item`.  If there is no such item return `default` if
+        provided else raise KeyError.
+        """
+        leaf = self._leaf(item)
+        if (i := bisect_left(leaf.keys, item)) < len(leaf.keys):
+            return leaf.keys[i]
+
+        return self._nearest(leaf.next, 0, item, default)
+
+    def lower(self, item, default=NO_DEFAULT):
+        """
+        Return the greatest item strictly less than `item`.  If there is no such item return `default` if
+        provided else raise KeyError.
+        """
+        leaf = self._leaf(item)
+        if i := bisect_left(leaf.keys, item):
+            return leaf.keys[i - 1]
+
+        return self._nearest(leaf.prev, -1, item, default)
+
+    def higher(self, item, default=NO_DEFAULT):
+        """
+        Return the least item strictly greater than `item`.  If there is no such item return `default` if
+        provided else raise KeyError.
+        """
+        leaf = self._leaf(item)
+        if (i := bisect_right(leaf.keys, item)) < len(leaf.keys):
+            return leaf.keys[i]
+
+        return self._nearest(leaf.next, 0, item, default)
+
+    def _nearest(self, leaf, i, item, default):
+        if leaf is not None:
+            return leaf.keys[i]
+
+        if default is NO_DEFAULT:
+            raise KeyError(item)
+
+        return default
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True), reverse=False):
+        """
+        Iterate over items between `lo` and `hi` in sorted order (or reverse sorted order if `reverse`).
+
+        A bound of None is unbounded.  `inclusive` is a pair of booleans indicating whether `lo` and `hi` are
+        included in the range.
+        """
+        lo_bisect = bisect_left if inclusive[0] else bisect_right
+        hi_bisect = bisect_right if inclusive[1] else bisect_left
+
+        if reverse:
+            leaf = self._last_leaf() if hi is None else self._leaf(hi)
+            while leaf is not None:
+                keys = leaf.keys
+                i = 0 if lo is None else lo_bisect(keys, lo)
+                j = len(keys) if hi is None else hi_bisect(keys, hi)
+
+                yield from reversed(keys[i:j])
+
+                if i:
+                    return
+
+                leaf = leaf.prev
+        else:
+            leaf = self._first_leaf() if lo is None else self._leaf(lo)
+            while leaf is not None:
+                keys = leaf.keys
+                i = 0 if lo is None else lo_bisect(keys, lo)
+                j = len(keys) if hi is None else hi_bisect(keys, hi)
+
+                yield from keys[i:j]
+
+                if j < len(keys):
+                    return
+
+                leaf = leaf.next
+
+    def __repr__(self):
+        return f'{type(self).__name__}([{", ".join(map(repr, self))}])'
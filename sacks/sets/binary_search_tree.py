@@ -1,6 +1,26 @@
 from collections.abc import MutableSet, Reversible
+from itertools import islice
 
-from ..primitives.bst_node import EMPTY
+from ..iterators.ring_buffer import NO_DEFAULT
+from ..primitives.bst_node import BSTNode, EMPTY
+
+
+def is_sorted(items):
+    """Return whether the sequence `items` is in non-decreasing order.
+    """
+    return all(not b < a for a, b in zip(items, islice(items, 1, None)))
+
+def build(keys, lo, hi):
+    """Return the root of a perfectly balanced tree from the sorted sequence `keys[lo:hi]`.
+    """
+    if lo == hi:
+        return EMPTY
+
+    mid = (lo + hi) // 2
+    node = BSTNode(keys[mid])
+    node.left = build(keys, lo, mid)
+    node.right = build(keys, mid + 1, hi)
+    return node
 
 
 class BinarySearchTree(MutableSet, Reversible):
@@ -15,10 +35,36 @@ class BinarySearchTree(MutableSet, Reversible):
     __slots__ = '_root', '_len',
 
     def __init__(self, iterable=()):
-        self._root = EMPTY
-        self._len = 0
+        items = list(iterable)
+
+        if is_sorted(items):
+            self._root = self._build(items)
+            self._len = len(items)
+        else:
+            self._root = self._build(())
+            self._len = 0
 
-        self |= iterable
+            self |= items
+
+    @staticmethod
+    def _build(keys):
+        return build(keys, 0, len(keys))
+
+    @classmethod
+    def from_sorted(cls, iterable):
+        """
+        Return a perfectly balanced tree of the items in `iterable` in O(n).
+
+        Warning
+        -------
+        Items must already be in sorted order; this isn't checked.
+
+        """
+        tree = cls()
+        keys = list(iterable)
+        tree._root = tree._build(keys)
+        tree._len = len(keys)
+        return tree
 
     @property
     def root(self):
@@ -48,6 +94,125 @@ class BinarySearchTree(MutableSet, Reversible):
 
         return current.key
 
+    def _nearest(self, node, item, default):
+        if node:
+            return node.key
+
+        if default is NO_DEFAULT:
+            raise KeyError(item)
+
+        return default
+
+    def floor(self, item, default=NO_DEFAULT):
+        """
+        Return the greatest item less than or equal to `item`.  If there is no such item return `default` if
+        provided else raise KeyError.
+        """
+        best, current = EMPTY, self._root
+        while current:
+            if item < current.key:
+                current = current.left
+            else:
+                best, current = current, current.right
+
+        return self._nearest(best, item, default)
+
+    def ceiling(self, item, default=NO_DEFAULT):
+        """
+        Return the least item greater than or equal to `item`.  If there is no such item return `default` if
+        provided else raise KeyError.
+        """
+        best, current = EMPTY, self._root
+        while current:
+            if current.key < item:
+                current = current.right
+            else:
+                best, current = current, current.left
+
+        return self._nearest(best, item, default)
+
+    def lower(self, item, default=NO_DEFAULT):
+        """
+        Return the greatest item strictly less than `item`.  If there is no such item return `default` if
+        provided else raise KeyError.
+        """
+        best, current = EMPTY, self._root
+        while current:
+            if current.key < item:
+                best, current = current, current.right
+            else:
+                current = current.left
+
+        return self._nearest(best, item, default)
+
+    def higher(self, item, default=NO_DEFAULT):
+        """
+        Return the least item strictly greater than `item`.  If there is no such item return `default` if
+        provided else raise KeyError.
+        """
+        best, current = EMPTY, self._root
+        while current:
+            if item < current.key:
+                best, current = current, current.left
+            else:
+                current = current.right
+
+        return self._nearest(best, item, default)
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True), reverse=False):
+        """
+        Iterate over items between `lo` and `hi` in sorted order (or reverse sorted order if `reverse`).
+
+        A bound of None is unbounded.  `inclusive` is a pair of booleans indicating whether `lo` and `hi` are
+        included in the range.
+
+        Notes
+        -----
+        Subtrees entirely outside the range are never visited, so iterating over k items takes O(log n + k).
+
+        """
+        lo_inclusive, hi_inclusive = inclusive
+
+        if lo is None:
+            below = lambda key: False
+        elif lo_inclusive:
+            below = lambda key: key < lo
+        else:
+            below = lambda key: not lo < key
+
+        if hi is None:
+            above = lambda key: False
+        elif hi_inclusive:
+            above = lambda key: hi < key
+        else:
+            above = lambda key: not key < hi
+
+        if reverse:
+            below, above = above, below
+            first, second = 'right', 'left'
+        else:
+            first, second = 'left', 'right'
+
+        stack = [ ]
+        current = self._root
+        while True:
+            while current:
+                if below(current.key):
+                    current = getattr(current, second)
+                else:
+                    stack.append(current)
+                    current = getattr(current, first)
+
+            if not stack:
+                return
+
+            current = stack.pop()
+            if above(current.key):
+                return
+
+            yield current.key
+            current = getattr(current, second)
+
     def __len__(self):
         return self._len
 
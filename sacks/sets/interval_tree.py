@@ -0,0 +1,77 @@
+from .avl_tree import AVLTree, build
+from ..primitives.interval_node import IntervalNode
+
+
+def check_interval(interval):
+    start, end = interval
+    if end < start:
+        raise ValueError(f'interval end is before its start: {interval!r}')
+
+
+class IntervalTree(AVLTree):
+    """
+    An AVLTree of closed intervals, `(start, end)` pairs, that can report every interval overlapping a point or
+    another interval.
+
+    Notes
+    -----
+    Intervals are ordered by start (then end) and each node also tracks the greatest end in its subtree, which is
+    kept up-to-date through rotations, joins and splits.
+
+    Queries skip subtrees whose greatest end is before the query and stop at the first start after it.  Each
+    reported interval costs at most O(log n) extra, so a query that reports k intervals takes O(min(n, k log n))
+    and is close to O(log n + k) in practice.
+
+    """
+    __slots__ = ()
+
+    _node_type = IntervalNode
+
+    def __init__(self, intervals=()):
+        intervals = sorted(intervals)
+
+        for interval in intervals:
+            check_interval(interval)
+
+        super().__init__(intervals)
+
+    @staticmethod
+    def _build(keys):
+        return build(keys, 0, len(keys), IntervalNode)
+
+    def add(self, interval):
+        check_interval(interval)
+
+        if self._root:
+            super().add(interval)
+        else:
+            self._root = IntervalNode(interval)
+            self._len = 1
+
+    def overlapping(self, lo, hi):
+        """Yield intervals that overlap the closed interval `[lo, hi]` in sorted order.
+        """
+        stack = [ ]
+        node = self._root
+        while True:
+            while node and not node.max_end < lo:
+                stack.append(node)
+                node = node.left
+
+            if not stack:
+                return
+
+            node = stack.pop()
+            start, end = node.key
+            if hi < start:
+                return
+
+            if not end < lo:
+                yield node.key
+
+            node = node.right
+
+    def stabbing(self, point):
+        """Yield intervals that contain `point` in sorted order.
+        """
+        return self.overlapping(point, point)
@@ -0,0 +1,55 @@
+class OrderStatistics:
+    """
+    Order statistics for a binary search tree whose nodes keep the `size` of their subtree.
+
+    Notes
+    -----
+    Expects `_root` and `_len` from BinarySearchTree.  Each method walks a single path from the root, so they're
+    O(height).
+
+    """
+    __slots__ = ()
+
+    def select(self, k):
+        """Return the `k`-th least item.
+        """
+        if not 0 <= k < self._len:
+            raise IndexError(f'index {k} out of range')
+
+        current = self._root
+        while True:
+            left_size = current.left.size
+            if k < left_size:
+                current = current.left
+            elif k > left_size:
+                k -= left_size + 1
+                current = current.right
+            else:
+                return current.key
+
+    def rank(self, item):
+        """Return the number of items less than `item`.
+        """
+        rank = 0
+        current = self._root
+        while current:
+            if current.key < item:
+                rank += current.left.size + 1
+                current = current.right
+            else:
+                current = current.left
+        return rank
+
+    def count_range(self, lo, hi):
+        """Return the number of items `x` with `lo <= x < hi`.
+        """
+        return max(self.rank(hi) - self.rank(lo), 0)
+
+    def __getitem__(self, index):
+        if not isinstance(index, int):
+            raise TypeError(f'index must be int, not {type(index).__name__}')
+
+        if index < 0:
+            index += self._len
+
+        return self.select(index)
@@ -0,0 +1,142 @@
+from .binary_search_tree import BinarySearchTree
+from .order_statistics import OrderStatistics
+from ..primitives.treap_node import EMPTY, TreapNode, merge, split
+
+
+def union(a, b):
+    """Return the union of the treaps at `a` and `b`.  O(m log(n / m + 1)) expected for treaps of sizes m <= n.
+    """
+    if not a:
+        return b
+
+    if not b:
+        return a
+
+    if a.priority < b.priority:
+        a, b = b, a
+
+    left, right = split(b, a.key)
+    a.left = union(a.left, left)
+    a.right = union(a.right, right)
+    a.update()
+    return a
+
+def copy(root):
+    """Return a copy of the treap at `root`.
+    """
+    if not root:
+        return EMPTY
+
+    node = TreapNode(root.key)
+    node.left = copy(root.left)
+    node.right = copy(root.right)
+    node.priority = root.priority
+    node.size = root.size
+    return node
+
+def build(keys):
+    """Return the root of a treap from the sorted sequence `keys` in O(n).
+    """
+    stack = [ ]
+    for key in keys:
+        node = TreapNode(key)
+
+        last = EMPTY
+        while stack and stack[-1].priority < node.priority:
+            last = stack.pop()
+            last.update()
+
+        node.left = last
+        if stack:
+            stack[-1].right = node
+
+        stack.append(node)
+
+    while stack:
+        last = stack.pop()
+        last.update()
+
+    return last if keys else EMPTY
+
+
+class Treap(OrderStatistics, BinarySearchTree):
+    """
+    A randomized binary search tree.  Nodes are ordered by key and heap-ordered by a random priority, which keeps
+    the tree balanced in expectation.
+
+    Notes
+    -----
+    This version of a treap allows multiple of the same item to be inserted.
+
+    Containment, addition, deletion, `split`, `merge` and order statistics are O(log n) expected.  Union with
+    another Treap is O(m log(n / m + 1)) expected for treaps of sizes m <= n.
+
+    """
+    __slots__ = ()
+
+    @staticmethod
+    def _build(keys):
+        return build(keys)
+
+    def add(self, item):
+        self._root = self._root.add_key(item)
+        self._len += 1
+
+    def remove(self, item):
+        self._root = self._root.remove_key(item)
+        self._len -= 1
+
+    def copy(self):
+        """Return a copy of this treap.
+        """
+        tree = type(self)()
+        tree._root = copy(self._root)
+        tree._len = self._len
+        return tree
+
+    def merge(self, other):
+        """
+        Move all items of `other` to the end of this treap.  O(log n)
+
+        Warning
+        -------
+        This is destructive.  `other` will be empty afterwards.
+
+        Raises
+        ------
+        ValueError if an item of `other` is less than an item of this treap.
+
+        """
+        if self and other and other.min < self.max:
+            raise ValueError('items of other must not be less than items of this treap')
+
+        self._root = merge(self._root, other._root)
+        self._len += other._len
+
+        other._root = EMPTY
+        other._len = 0
+
+    def split(self, item):
+        """Keep items less than `item` in this treap and move the rest to a new treap.  Return both treaps. O(log n)
+        """
+        right = type(self)()
+        self._root, right._root = split(self._root, item)
+        right._len = right._root.size
+        self._len -= right._len
+        return self, right
+
+    def __ior__(self, other):
+        if not isinstance(other, Treap):
+            return super().__ior__(other)
+
+        self._root = union(self._root, copy(other._root))
+        self._len += other._len
+        return self
+
+    def __or__(self, other):
+        if not isinstance(other, Treap):
+            return super().__or__(other)
+
+        tree = self.copy()
+        tree |= other
+        return tree